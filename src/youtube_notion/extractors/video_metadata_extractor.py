@@ -24,6 +24,18 @@ from ..utils.exceptions import (
 from ..utils.video_utils import parse_iso8601_duration
 
 
+# Hosts serving youtube.com-style URLs (/watch, /embed/, /v/)
+_YOUTUBE_DOMAINS = ('youtube.com', 'www.youtube.com', 'm.youtube.com')
+
+# Hosts serving youtu.be short URLs (video ID in the path)
+_SHORT_URL_DOMAINS = ('youtu.be',)
+
+_SUPPORTED_DOMAINS = _YOUTUBE_DOMAINS + _SHORT_URL_DOMAINS
+
+# YouTube video IDs: exactly 11 letters, digits, hyphens or underscores
+_VIDEO_ID_PATTERN = re.compile(r'[a-zA-Z0-9_-]{11}')
+
+
 class VideoMetadataExtractor:
     """
     Extracts metadata from YouTube videos using API or web scraping.
@@ -55,6 +67,9 @@ class VideoMetadataExtractor:
         
         self.youtube_api_key = youtube_api_key
         self.timeout_seconds = timeout_seconds
+        
+        # YouTube Data API client, built on first API call and reused afterwards
+        self._youtube_service = None
     
     def validate_configuration(self) -> bool:
         """
@@ -152,24 +167,24 @@ class VideoMetadataExtractor:
             raise InvalidURLError("Invalid URL format", details=str(e))
         
         # Check if it's a YouTube domain
-        valid_domains = ['youtube.com', 'www.youtube.com', 'm.youtube.com', 'youtu.be']
-        if parsed_url.netloc.lower() not in valid_domains:
+        domain = parsed_url.netloc.lower()
+        if domain not in _SUPPORTED_DOMAINS:
             raise InvalidURLError(
                 "URL is not from a supported YouTube domain",
-                details=f"Domain: {parsed_url.netloc}, Supported: {', '.join(valid_domains)}"
+                details=f"Domain: {parsed_url.netloc}, Supported: {', '.join(_SUPPORTED_DOMAINS)}"
             )
         
         video_id = None
         
         # Handle youtu.be short URLs
-        if parsed_url.netloc.lower() == 'youtu.be':
+        if domain in _SHORT_URL_DOMAINS:
             # For youtu.be/VIDEO_ID, the video ID is in the path
             path_parts = parsed_url.path.strip('/').split('/')
             if path_parts and path_parts[0]:
                 video_id = path_parts[0]
         
         # Handle youtube.com URLs
-        elif parsed_url.netloc.lower() in ['youtube.com', 'www.youtube.com', 'm.youtube.com']:
+        elif domain in _YOUTUBE_DOMAINS:
             # Check for /watch URLs
             if parsed_url.path == '/watch':
                 query_params = parse_qs(parsed_url.query)
@@ -275,12 +290,8 @@ class VideoMetadataExtractor:
         if not video_id or not isinstance(video_id, str):
             return False
         
-        # YouTube video IDs are exactly 11 characters
-        if len(video_id) != 11:
-            return False
-        
-        # Check if all characters are valid (alphanumeric, hyphen, underscore)
-        return re.match(r'^[a-zA-Z0-9_-]{11}$', video_id) is not None
+        # Exactly 11 valid characters (alphanumeric, hyphen, underscore)
+        return _VIDEO_ID_PATTERN.fullmatch(video_id) is not None
     
     def _get_video_metadata(self, video_id: str) -> Dict[str, str]:
         """
@@ -326,6 +337,21 @@ class VideoMetadataExtractor:
             # No API key available, use web scraping directly
             return self._get_metadata_via_scraping(video_id)
     
+    def _get_youtube_service(self):
+        """
+        Get the YouTube Data API client, building it on first use.
+        
+        Building the client loads the API discovery document and sets up a
+        new HTTP connection, so it is done once per extractor rather than
+        once per video.
+        
+        Returns:
+            Resource: YouTube Data API v3 client
+        """
+        if self._youtube_service is None:
+            self._youtube_service = build('youtube', 'v3', developerKey=self.youtube_api_key)
+        return self._youtube_service
+    
     def _get_metadata_via_api(self, video_id: str) -> Dict[str, str]:
         """
         Get video metadata using YouTube Data API v3.
@@ -342,8 +368,7 @@ class VideoMetadataExtractor:
             QuotaExceededError: If API quota is exceeded
         """
         try:
-            # Build YouTube API client
-            youtube = build('youtube', 'v3', developerKey=self.youtube_api_key)
+            youtube = self._get_youtube_service()
             
             # Request video details
             request = youtube.videos().list(
@@ -7,12 +7,13 @@ operations, observable pattern for real-time updates, and sequential
 video processing with proper error handling.
 """
 
+import itertools
 import threading
 import time
 import uuid
-from datetime import datetime
-from typing import Dict, List, Optional, Callable, Any, TYPE_CHECKING
-from queue import Queue, Empty
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Deque, Dict, List, Optional, Set, Tuple, Callable, Any, TYPE_CHECKING
 from ..web.models import QueueItem, QueueStatus, ProcessingPhase
 from typing import TYPE_CHECKING
 
@@ -54,10 +55,23 @@ class QueueManager:
         # Thread-safe data structures
         self._lock = threading.RLock()  # Reentrant lock for nested operations
         self._items: Dict[str, QueueItem] = {}
-        self._processing_queue: Queue = Queue(maxsize=max_queue_size)
+        # Item IDs grouped by status, kept in step with item.status so status
+        # queries don't have to scan every item
+        self._ids_by_status: Dict[QueueStatus, Set[str]] = {status: set() for status in QueueStatus}
+        
+        # Item IDs: a random per-instance prefix keeps IDs from a previous
+        # server run from matching new items, the counter keeps them unique
+        self._id_prefix = uuid.uuid4().hex[:8]
+        self._id_counter = itertools.count(1)
+        # deque append/popleft are atomic, so the hot path needs no lock;
+        # the event wakes the processing thread when new work arrives
+        self._processing_queue: Deque[str] = deque()
+        self._item_available = threading.Event()
         
         # Status change listeners for observable pattern
-        self._status_listeners: List[Callable[[str, QueueItem], None]] = []
+        # Stored as a tuple and replaced on add/remove, so notification can
+        # iterate the current tuple without copying or locking
+        self._status_listeners: Tuple[Callable[[str, QueueItem], None], ...] = ()
         
         # Background processing thread
         self._processing_thread: Optional[threading.Thread] = None
@@ -100,7 +114,7 @@ class QueueManager:
                 raise ValueError(f"Queue is full (max {self.max_queue_size} items)")
             
             # Generate unique item ID
-            item_id = str(uuid.uuid4())
+            item_id = f"{self._id_prefix}-{next(self._id_counter):06d}"
             
             # Create queue item
             queue_item = QueueItem(
@@ -114,9 +128,11 @@ class QueueManager:
             try:
                 # Add to internal storage
                 self._items[item_id] = queue_item
+                self._ids_by_status[QueueStatus.TODO].add(item_id)
                 
                 # Add to processing queue
-                self._processing_queue.put(item_id, block=False)
+                self._processing_queue.append(item_id)
+                self._item_available.set()
                 
                 # Notify listeners
                 self._notify_status_change(item_id, queue_item)
@@ -126,6 +142,7 @@ class QueueManager:
             except Exception as e:
                 # Clean up on failure
                 self._items.pop(item_id, None)
+                self._ids_by_status[QueueStatus.TODO].discard(item_id)
                 raise VideoProcessingError(f"Failed to enqueue item: {str(e)}")
     
     def dequeue(self) -> Optional[str]:
@@ -138,8 +155,8 @@ class QueueManager:
             Optional[str]: Item ID if available, None if queue is empty
         """
         try:
-            return self._processing_queue.get(block=False)
-        except Empty:
+            return self._processing_queue.popleft()
+        except IndexError:
             return None
     
     def get_queue_status(self) -> Dict[str, List[QueueItem]]:
@@ -153,29 +170,19 @@ class QueueManager:
                 - 'completed': Successfully processed items
                 - 'failed': Items that failed processing
         """
+        # Only collect the groups under the lock; sorting happens outside it
+        # so enqueues and status updates are not blocked
         with self._lock:
             status_groups = {
-                'todo': [],
-                'in_progress': [],
-                'completed': [],
-                'failed': []
+                status.value: [self._items[item_id] for item_id in item_ids]
+                for status, item_ids in self._ids_by_status.items()
             }
-            
-            for item in self._items.values():
-                if item.status == QueueStatus.TODO:
-                    status_groups['todo'].append(item)
-                elif item.status == QueueStatus.IN_PROGRESS:
-                    status_groups['in_progress'].append(item)
-                elif item.status == QueueStatus.COMPLETED:
-                    status_groups['completed'].append(item)
-                elif item.status == QueueStatus.FAILED:
-                    status_groups['failed'].append(item)
-            
-            # Sort by creation time (oldest first)
-            for status_list in status_groups.values():
-                status_list.sort(key=lambda x: x.created_at)
-            
-            return status_groups
+        
+        # Sort by creation time (oldest first)
+        for status_list in status_groups.values():
+            status_list.sort(key=lambda x: x.created_at)
+        
+        return status_groups
     
     def get_item_status(self, item_id: str) -> Optional[QueueItem]:
         """
@@ -217,6 +224,8 @@ class QueueManager:
             # Update status and timestamps
             old_status = item.status
             item.status = status
+            self._ids_by_status[old_status].discard(item_id)
+            self._ids_by_status[status].add(item_id)
             
             if status == QueueStatus.IN_PROGRESS and old_status == QueueStatus.TODO:
                 item.started_at = datetime.now()
@@ -277,8 +286,9 @@ class QueueManager:
             if not self._processing_active:
                 return True
             
-            # Signal shutdown
+            # Signal shutdown and wake the thread if it is idle
             self._shutdown_event.set()
+            self._item_available.set()
             self._processing_active = False
         
         # Wait for thread to finish (outside of lock to avoid deadlock)
@@ -305,7 +315,7 @@ class QueueManager:
         
         with self._lock:
             if callback not in self._status_listeners:
-                self._status_listeners.append(callback)
+                self._status_listeners = self._status_listeners + (callback,)
     
     def remove_status_listener(self, callback: Callable[[str, QueueItem], None]) -> None:
         """
@@ -315,8 +325,11 @@ class QueueManager:
             callback: Function to remove from listeners
         """
         with self._lock:
-            if callback in self._status_listeners:
-                self._status_listeners.remove(callback)
+            # Compare by equality, not identity: bound methods are recreated
+            # on every attribute access
+            self._status_listeners = tuple(
+                listener for listener in self._status_listeners if listener != callback
+            )
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -334,16 +347,10 @@ class QueueManager:
             })
             
             # Add status breakdown
-            status_counts = {'todo': 0, 'in_progress': 0, 'completed': 0, 'failed': 0}
-            for item in self._items.values():
-                if item.status == QueueStatus.TODO:
-                    status_counts['todo'] += 1
-                elif item.status == QueueStatus.IN_PROGRESS:
-                    status_counts['in_progress'] += 1
-                elif item.status == QueueStatus.COMPLETED:
-                    status_counts['completed'] += 1
-                elif item.status == QueueStatus.FAILED:
-                    status_counts['failed'] += 1
+            status_counts = {
+                status.value: len(item_ids)
+                for status, item_ids in self._ids_by_status.items()
+            }
             
             # Add both nested and flat format for compatibility
             current_stats['status_counts'] = status_counts
@@ -386,21 +393,24 @@ class QueueManager:
         Returns:
             int: Number of items cleared
         """
-        cutoff_time = datetime.now().timestamp() - (max_age_hours * 3600)
+        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
         cleared_count = 0
         
         with self._lock:
-            items_to_remove = []
-            
-            for item_id, item in self._items.items():
-                if (item.status in [QueueStatus.COMPLETED, QueueStatus.FAILED] and
-                    item.completed_at and 
-                    item.completed_at.timestamp() < cutoff_time):
-                    items_to_remove.append(item_id)
-            
-            for item_id in items_to_remove:
-                del self._items[item_id]
-                cleared_count += 1
+            # Only finished items can be cleared, so look at those buckets
+            # instead of scanning the whole queue
+            for status in (QueueStatus.COMPLETED, QueueStatus.FAILED):
+                finished_ids = self._ids_by_status[status]
+                stale_ids = []
+                for item_id in finished_ids:
+                    completed_at = self._items[item_id].completed_at
+                    if completed_at and completed_at < cutoff_time:
+                        stale_ids.append(item_id)
+                
+                finished_ids.difference_update(stale_ids)
+                for item_id in stale_ids:
+                    del self._items[item_id]
+                cleared_count += len(stale_ids)
         
         return cleared_count
     
@@ -417,8 +427,11 @@ class QueueManager:
                 item_id = self.dequeue()
                 
                 if item_id is None:
-                    # No items to process, wait a bit
-                    time.sleep(0.1)
+                    # No items to process, wait until one is enqueued. Clear
+                    # first and re-check so an append in between is not lost.
+                    self._item_available.clear()
+                    if not self._processing_queue:
+                        self._item_available.wait(timeout=0.1)
                     continue
                 
                 # Process the item
@@ -747,12 +760,9 @@ class QueueManager:
             item_id: ID of the item that changed
             item: The updated queue item
         """
-        # Create a copy of listeners to avoid issues with concurrent modification
-        with self._lock:
-            listeners = self._status_listeners.copy()
-        
-        # Call listeners outside of lock to avoid deadlocks
-        for listener in listeners:
+        # The tuple is never mutated, so iterating the current reference is
+        # safe even if listeners are added or removed concurrently
+        for listener in self._status_listeners:
             try:
                 listener(item_id, item)
             except Exception as e:
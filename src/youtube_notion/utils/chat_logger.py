@@ -7,11 +7,15 @@ interactions for review and debugging purposes.
 
 import os
 import json
+import re
 from datetime import datetime
 from typing import Dict, Any, Optional
 from pathlib import Path
 
 
+_CHUNK_INDEX_PATTERN = re.compile(r'_chunk_(\d+)_')
+
+
 class ChatLogger:
     """
     Utility class for logging Gemini API chat conversations.
@@ -278,18 +282,10 @@ class ChatLogger:
         
         # Sort by chunk index (extract from filename)
         def extract_chunk_index(filepath):
-            try:
-                # Extract chunk index from filename like "video_id_chunk_0_timestamp.md"
-                filename = filepath.stem
-                parts = filename.split('_')
-                chunk_idx = None
-                for i, part in enumerate(parts):
-                    if part == 'chunk' and i + 1 < len(parts):
-                        chunk_idx = int(parts[i + 1])
-                        break
-                return chunk_idx if chunk_idx is not None else 0
-            except (ValueError, IndexError):
-                return 0
+            # Extract chunk index from filename like "video_id_chunk_0_timestamp.md";
+            # files without a numeric index sort first
+            match = _CHUNK_INDEX_PATTERN.search(filepath.stem)
+            return int(match.group(1)) if match else 0
         
         chunk_files.sort(key=extract_chunk_index)
         return [str(f) for f in chunk_files]
\ No newline at end of file
@@ -7,6 +7,13 @@ import re
 from urllib.parse import urlparse, parse_qs
 
 
+# Regex to match timestamps in brackets
+# Matches: [8:05], [8:05-8:24], [0:01-0:07, 0:56-1:21]
+_TIMESTAMP_PATTERN = re.compile(
+    r'\[([0-9]+:[0-9]+(?:-[0-9]+:[0-9]+)?(?:\s*,\s*[0-9]+:[0-9]+(?:-[0-9]+:[0-9]+)?)*)\]'
+)
+
+
 def parse_rich_text(text):
     """Parse text with markdown formatting to Notion rich text format.
     
@@ -465,8 +472,4 @@ def enrich_timestamps_with_links(markdown_text, video_url):
                 # If parsing fails, return original
                 return full_match
     
-    # Regex to match timestamps in brackets
-    # Matches: [8:05], [8:05-8:24], [0:01-0:07, 0:56-1:21]
-    timestamp_pattern = r'\[([0-9]+:[0-9]+(?:-[0-9]+:[0-9]+)?(?:\s*,\s*[0-9]+:[0-9]+(?:-[0-9]+:[0-9]+)?)*)\]'
-    
-    return re.sub(timestamp_pattern, replace_timestamp_match, markdown_text)
\ No newline at end of file
+    return _TIMESTAMP_PATTERN.sub(replace_timestamp_match, markdown_text)
\ No newline at end of file
@@ -28,7 +28,7 @@ class ProcessingPhase(Enum):
     NOTION_UPLOAD = "Uploading to Notion"
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueItem:
     """
     Data model for queue items with status tracking.
@@ -81,6 +81,9 @@ class GeminiSummaryWriter(SummaryWriter):
         
         # Initialize chat logger
         self.chat_logger = chat_logger or ChatLogger()
+        
+        # Gemini client, created on first API call and reused afterwards
+        self._client = None
     
     def generate_summary(self, video_url: str, video_metadata: Dict[str, Any],
                          custom_prompt: Optional[str] = None) -> str:
@@ -235,6 +238,20 @@ class GeminiSummaryWriter(SummaryWriter):
                 f"Configuration validation failed: {str(e)}"
             )
     
+    def _get_client(self) -> genai.Client:
+        """
+        Get the Gemini client, creating it on first use.
+        
+        Reusing one client keeps its HTTP connection pool alive across calls,
+        including the per-chunk calls made for long videos.
+        
+        Returns:
+            genai.Client: Client bound to the configured API key
+        """
+        if self._client is None:
+            self._client = genai.Client(api_key=self.api_key)
+        return self._client
+    
     def _call_gemini_api(self, video_url: str, prompt: str,
                          start_offset: Optional[str] = None, end_offset: Optional[str] = None) -> str:
         """
@@ -254,8 +271,7 @@ class GeminiSummaryWriter(SummaryWriter):
             QuotaExceededError: If API quota is exceeded
         """
         try:
-            # Initialize Gemini client
-            client = genai.Client(api_key=self.api_key)
+            client = self._get_client()
             
             # Prepare video part
             video_part = types.Part(
@@ -285,8 +301,8 @@ class GeminiSummaryWriter(SummaryWriter):
                 response_mime_type="text/plain"
             )
             
-            # Stream response and collect full text
-            full_response = ""
+            # Stream response and collect chunks, joining once at the end
+            response_parts = []
             
             try:
                 for chunk in client.models.generate_content_stream(
@@ -295,7 +311,8 @@ class GeminiSummaryWriter(SummaryWriter):
                     config=generate_content_config
                 ):
                     if chunk.text:
-                        full_response += chunk.text
+                        response_parts.append(chunk.text)
+                full_response = "".join(response_parts)
             
             except Exception as stream_error:
                 # If streaming fails, try non-streaming approach
@@ -380,7 +397,7 @@ class GeminiSummaryWriter(SummaryWriter):
         Make a Gemini API call for text-only input.
         """
         try:
-            client = genai.Client(api_key=self.api_key)
+            client = self._get_client()
             contents = [types.Content(role="user", parts=[types.Part.from_text(text=prompt)])]
             generate_content_config = types.GenerateContentConfig(
                 temperature=self.temperature,
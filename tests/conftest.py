@@ -29,7 +29,9 @@ def pytest_configure(config):
 
 # Add src to Python path for package imports
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, os.path.join(project_root, 'src'))
+src_path = os.path.join(project_root, 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 
 @pytest.fixture
@@ -5,6 +5,7 @@ This module provides comprehensive test data for web UI components,
 including sample queue items, API responses, and SSE events.
 """
 
+from dataclasses import asdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 from src.youtube_notion.web.models import QueueItem, QueueStatus, ProcessingPhase
@@ -294,11 +295,11 @@ def create_sample_sse_events() -> List[Dict[str, Any]]:
             "type": "status_change",
             "data": {
                 "item_id": "test-item-1",
-                "item": create_sample_queue_item(
+                "item": asdict(create_sample_queue_item(
                     item_id="test-item-1",
                     status=QueueStatus.IN_PROGRESS,
                     current_phase=ProcessingPhase.METADATA_EXTRACTION.value
-                ).__dict__
+                ))
             },
             "timestamp": datetime.now().isoformat()
         },
@@ -331,10 +332,10 @@ def create_sample_api_responses() -> Dict[str, Dict[str, Any]]:
             "error": "Invalid YouTube URL format"
         },
         "queue_status": {
-            "todo": [item.__dict__ for item in create_sample_queue_status()['todo']],
-            "in_progress": [item.__dict__ for item in create_sample_queue_status()['in_progress']],
-            "completed": [item.__dict__ for item in create_sample_queue_status()['completed']],
-            "failed": [item.__dict__ for item in create_sample_queue_status()['failed']]
+            "todo": [asdict(item) for item in create_sample_queue_status()['todo']],
+            "in_progress": [asdict(item) for item in create_sample_queue_status()['in_progress']],
+            "completed": [asdict(item) for item in create_sample_queue_status()['completed']],
+            "failed": [asdict(item) for item in create_sample_queue_status()['failed']]
         },
         "chat_log": {
             "item_id": "completed-1",
@@ -6,38 +6,41 @@ run quickly without external dependencies.
 """
 
 import pytest
+from types import MappingProxyType
 from unittest.mock import Mock
 
-# Ensure unit tests don't accidentally load environment variables
-import os
-os.environ.pop('NOTION_TOKEN', None)
-os.environ.pop('GEMINI_API_KEY', None)
-os.environ.pop('YOUTUBE_API_KEY', None)
 
-
-@pytest.fixture
-def sample_video_metadata():
-    """Sample video metadata for testing."""
-    return {
-        'video_id': 'test123',
-        'title': 'Test Video Title',
-        'channel': 'Test Channel',
-        'description': 'Test video description',
-        'published_at': '2024-01-01T00:00:00Z',
-        'thumbnail_url': 'https://img.youtube.com/vi/test123/maxresdefault.jpg'
-    }
+@pytest.fixture(scope="package", autouse=True)
+def _strip_api_credentials():
+    """Ensure unit tests don't accidentally use real API credentials.
+    
+    The variables are removed while the tests/unit package runs and restored
+    once it finishes, so other test suites in the same run are unaffected.
+    """
+    mp = pytest.MonkeyPatch()
+    for name in ('NOTION_TOKEN', 'GEMINI_API_KEY', 'YOUTUBE_API_KEY'):
+        mp.delenv(name, raising=False)
+    yield
+    mp.undo()
+
+
+# Shared read-only sample metadata. The fixture hands out the same frozen
+# mapping to every test instead of building a new dict; tests that need to
+# modify it should take a copy with dict(...).
+_SAMPLE_VIDEO_METADATA = MappingProxyType({
+    'video_id': 'test123',
+    'title': 'Test Video Title',
+    'channel': 'Test Channel',
+    'description': 'Test video description',
+    'published_at': '2024-01-01T00:00:00Z',
+    'thumbnail_url': 'https://img.youtube.com/vi/test123/maxresdefault.jpg'
+})
 
 
 @pytest.fixture
-def sample_video_data():
-    """Sample processed video data for testing."""
-    return {
-        'Title': 'Test Video Title',
-        'Channel': 'Test Channel',
-        'Video URL': 'https://youtu.be/test123',
-        'Cover': 'https://img.youtube.com/vi/test123/maxresdefault.jpg',
-        'Summary': '# Test Summary\n\nThis is a test summary with [8:05] timestamp.'
-    }
+def sample_video_metadata():
+    """Sample video metadata for testing (read-only)."""
+    return _SAMPLE_VIDEO_METADATA
 
 
 @pytest.fixture
@@ -9,20 +9,61 @@ pattern, and error scenarios.
 import pytest
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
 
 from src.youtube_notion.processors.queue_manager import QueueManager
+from src.youtube_notion.processors.video_processor import VideoProcessor
 from src.youtube_notion.web.models import QueueItem, QueueStatus, ProcessingPhase
 from src.youtube_notion.utils.exceptions import VideoProcessingError, ConfigurationError
 
 
+_TERMINAL_STATUSES = (QueueStatus.COMPLETED, QueueStatus.FAILED)
+_TEST_URLS = tuple(f"https://youtu.be/test{i}" for i in range(10))
+
+
+def _wait_for_terminal(queue_manager, item_id, timeout=2.0):
+    """Block until the given item reaches a terminal status or timeout expires."""
+    done = threading.Event()
+    
+    def on_status_change(changed_id, item):
+        if changed_id == item_id and item.status in _TERMINAL_STATUSES:
+            done.set()
+    
+    queue_manager.add_status_listener(on_status_change)
+    try:
+        # The worker may have finished before the listener was registered
+        item = queue_manager.get_item_status(item_id)
+        if item and item.status in _TERMINAL_STATUSES:
+            return True
+        return done.wait(timeout)
+    finally:
+        queue_manager.remove_status_listener(on_status_change)
+
+
+@pytest.fixture
+def queue_manager():
+    """Create a QueueManager instance for testing."""
+    queue_manager = QueueManager(Mock(spec=VideoProcessor))
+    yield queue_manager
+    # Stop the worker even if the test failed before its own cleanup
+    queue_manager.stop_processing(timeout=1.0)
+
+
+@pytest.fixture(scope="module")
+def executor():
+    """Provide a thread pool shared by the concurrency tests."""
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        yield executor
+
+
 class TestQueueManagerInitialization:
     """Test QueueManager initialization and configuration."""
     
     def test_init_with_valid_processor(self):
         """Test successful initialization with valid VideoProcessor."""
-        mock_processor = Mock()
+        mock_processor = Mock(spec=VideoProcessor)
         queue_manager = QueueManager(mock_processor)
         
         assert queue_manager.video_processor == mock_processor
@@ -33,20 +74,16 @@ class TestQueueManagerInitialization:
     
     def test_init_with_custom_max_size(self):
         """Test initialization with custom max queue size."""
-        mock_processor = Mock()
+        mock_processor = Mock(spec=VideoProcessor)
         queue_manager = QueueManager(mock_processor, max_queue_size=50)
         
         assert queue_manager.max_queue_size == 50
     
-    def test_init_with_none_processor_raises_error(self):
-        """Test that initialization with None processor raises ConfigurationError."""
+    @pytest.mark.parametrize("processor", [None, "not_a_processor", 42])
+    def test_init_with_invalid_processor_raises_error(self, processor):
+        """Test that initialization with a missing or invalid processor raises ConfigurationError."""
         with pytest.raises(ConfigurationError, match="VideoProcessor is required"):
-            QueueManager(None)
-    
-    def test_init_with_invalid_processor_raises_error(self):
-        """Test that initialization with invalid processor raises ConfigurationError."""
-        with pytest.raises(ConfigurationError, match="VideoProcessor is required"):
-            QueueManager("not_a_processor")
+            QueueManager(processor)
 
 
 class TestQueueOperations:
@@ -55,7 +92,7 @@ class TestQueueOperations:
     @pytest.fixture
     def queue_manager(self):
         """Create a QueueManager instance for testing."""
-        mock_processor = Mock()
+        mock_processor = Mock(spec=VideoProcessor)
         return QueueManager(mock_processor, max_queue_size=5)
     
     def test_enqueue_valid_url(self, queue_manager):
@@ -74,6 +111,14 @@ class TestQueueOperations:
         assert item.custom_prompt is None
         assert isinstance(item.created_at, datetime)
     
+    def test_enqueue_generates_unique_ids_per_manager(self, queue_manager):
+        """Test that item IDs are unique within and across manager instances."""
+        first_id = queue_manager.enqueue("https://youtu.be/test123")
+        second_id = queue_manager.enqueue("https://youtu.be/test123")
+        other_id = QueueManager(Mock(spec=VideoProcessor)).enqueue("https://youtu.be/test123")
+        
+        assert len({first_id, second_id, other_id}) == 3
+    
     def test_enqueue_with_custom_prompt(self, queue_manager):
         """Test enqueuing URL with custom prompt."""
         url = "https://youtu.be/test123"
@@ -83,20 +128,11 @@ class TestQueueOperations:
         item = queue_manager.get_item_status(item_id)
         assert item.custom_prompt == custom_prompt
     
-    def test_enqueue_empty_url_raises_error(self, queue_manager):
-        """Test that enqueuing empty URL raises ValueError."""
+    @pytest.mark.parametrize("url", ["", None, 123, [], 0.0])
+    def test_enqueue_invalid_url_raises_error(self, queue_manager, url):
+        """Test that enqueuing an empty or non-string URL raises ValueError."""
         with pytest.raises(ValueError, match="URL must be a non-empty string"):
-            queue_manager.enqueue("")
-    
-    def test_enqueue_none_url_raises_error(self, queue_manager):
-        """Test that enqueuing None URL raises ValueError."""
-        with pytest.raises(ValueError, match="URL must be a non-empty string"):
-            queue_manager.enqueue(None)
-    
-    def test_enqueue_non_string_url_raises_error(self, queue_manager):
-        """Test that enqueuing non-string URL raises ValueError."""
-        with pytest.raises(ValueError, match="URL must be a non-empty string"):
-            queue_manager.enqueue(123)
+            queue_manager.enqueue(url)
     
     def test_enqueue_queue_full_raises_error(self, queue_manager):
         """Test that enqueuing when queue is full raises ValueError."""
@@ -140,18 +176,12 @@ class TestQueueOperations:
 class TestQueueStatusManagement:
     """Test queue status tracking and updates."""
     
-    @pytest.fixture
-    def queue_manager(self):
-        """Create a QueueManager instance for testing."""
-        mock_processor = Mock()
-        return QueueManager(mock_processor)
-    
     def test_get_queue_status_empty(self, queue_manager):
         """Test getting status of empty queue."""
         status = queue_manager.get_queue_status()
         
         assert isinstance(status, dict)
-        assert set(status.keys()) == {'todo', 'in_progress', 'completed', 'failed'}
+        assert status.keys() == {'todo', 'in_progress', 'completed', 'failed'}
         assert all(len(items) == 0 for items in status.values())
     
     def test_get_queue_status_with_items(self, queue_manager):
@@ -232,12 +262,6 @@ class TestQueueStatusManagement:
 class TestObservablePattern:
     """Test status change listeners and observable pattern."""
     
-    @pytest.fixture
-    def queue_manager(self):
-        """Create a QueueManager instance for testing."""
-        mock_processor = Mock()
-        return QueueManager(mock_processor)
-    
     def test_add_status_listener(self, queue_manager):
         """Test adding status change listener."""
         listener = Mock()
@@ -258,6 +282,18 @@ class TestObservablePattern:
         
         assert listener not in queue_manager._status_listeners
     
+    def test_remove_bound_method_listener(self, queue_manager):
+        """Test removing a bound method listener passed as a fresh reference."""
+        class Subscriber:
+            def on_status_change(self, item_id, item):
+                pass
+        
+        subscriber = Subscriber()
+        queue_manager.add_status_listener(subscriber.on_status_change)
+        queue_manager.remove_status_listener(subscriber.on_status_change)
+        
+        assert len(queue_manager._status_listeners) == 0
+    
     def test_remove_nonexistent_listener(self, queue_manager):
         """Test removing non-existent listener doesn't raise error."""
         listener = Mock()
@@ -324,13 +360,6 @@ class TestObservablePattern:
 class TestBackgroundProcessing:
     """Test background processing thread functionality."""
     
-    @pytest.fixture
-    def queue_manager(self):
-        """Create a QueueManager instance for testing."""
-        mock_processor = Mock()
-        mock_processor.process_video.return_value = True
-        return QueueManager(mock_processor)
-    
     def test_start_processing(self, queue_manager):
         """Test starting background processing."""
         queue_manager.start_processing()
@@ -338,9 +367,6 @@ class TestBackgroundProcessing:
         assert queue_manager._processing_active is True
         assert queue_manager._processing_thread is not None
         assert queue_manager._processing_thread.is_alive()
-        
-        # Clean up
-        queue_manager.stop_processing()
     
     def test_start_processing_already_active_raises_error(self, queue_manager):
         """Test starting processing when already active raises RuntimeError."""
@@ -348,9 +374,6 @@ class TestBackgroundProcessing:
         
         with pytest.raises(RuntimeError, match="Processing is already active"):
             queue_manager.start_processing()
-        
-        # Clean up
-        queue_manager.stop_processing()
     
     def test_stop_processing(self, queue_manager):
         """Test stopping background processing."""
@@ -409,7 +432,7 @@ class TestBackgroundProcessing:
         item_id = queue_manager.enqueue("https://youtu.be/test123")
         
         # Wait for processing
-        time.sleep(0.5)
+        assert _wait_for_terminal(queue_manager, item_id)
         
         # Check that item was processed
         item = queue_manager.get_item_status(item_id)
@@ -424,9 +447,6 @@ class TestBackgroundProcessing:
         mock_metadata_extractor.extract_metadata.assert_called_once_with("https://youtu.be/test123")
         mock_summary_writer.generate_summary.assert_called_once()
         mock_storage.store_video_summary.assert_called_once()
-        
-        # Clean up
-        queue_manager.stop_processing()
     
     def test_background_processing_handles_failures(self, queue_manager):
         """Test that background thread handles processing failures."""
@@ -463,15 +483,12 @@ class TestBackgroundProcessing:
         item_id = queue_manager.enqueue("https://youtu.be/test123")
         
         # Wait for processing
-        time.sleep(0.2)
+        assert _wait_for_terminal(queue_manager, item_id)
         
         # Check that item failed
         item = queue_manager.get_item_status(item_id)
         assert item.status == QueueStatus.FAILED
         assert "Storage operation failed" in item.error_message
-        
-        # Clean up
-        queue_manager.stop_processing()
     
     def test_background_processing_handles_exceptions(self, queue_manager):
         """Test that background thread handles processing exceptions."""
@@ -495,56 +512,37 @@ class TestBackgroundProcessing:
         item_id = queue_manager.enqueue("https://youtu.be/test123")
         
         # Wait for processing
-        time.sleep(0.2)
+        assert _wait_for_terminal(queue_manager, item_id)
         
         # Check that item failed with error message
         item = queue_manager.get_item_status(item_id)
         assert item.status == QueueStatus.FAILED
         assert "Processing error" in item.error_message
-        
-        # Clean up
-        queue_manager.stop_processing()
 
 
 class TestConcurrency:
     """Test thread-safe operations and concurrency handling."""
     
-    @pytest.fixture
-    def queue_manager(self):
-        """Create a QueueManager instance for testing."""
-        mock_processor = Mock()
-        mock_processor.process_video.return_value = True
-        return QueueManager(mock_processor, max_queue_size=100)
-    
-    def test_concurrent_enqueue_operations(self, queue_manager):
+    def test_concurrent_enqueue_operations(self, queue_manager, executor):
         """Test multiple threads enqueuing items concurrently."""
         results = []
-        errors = []
-        
-        def enqueue_items(thread_id, count):
-            try:
-                for i in range(count):
-                    item_id = queue_manager.enqueue(f"https://youtu.be/thread{thread_id}_item{i}")
-                    results.append(item_id)
-            except Exception as e:
-                errors.append(e)
-        
-        # Create multiple threads
-        threads = []
-        for i in range(5):
-            thread = threading.Thread(target=enqueue_items, args=(i, 10))
-            threads.append(thread)
+        # Build the URLs up front so the threads only exercise enqueue
+        url_batches = [
+            [f"https://youtu.be/thread{thread_id}_item{i}" for i in range(10)]
+            for thread_id in range(5)
+        ]
+        
+        def enqueue_items(urls):
+            for url in urls:
+                results.append(queue_manager.enqueue(url))
         
-        # Start all threads
-        for thread in threads:
-            thread.start()
+        futures = [executor.submit(enqueue_items, urls) for urls in url_batches]
         
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        # result() re-raises any exception from the worker thread
+        for future in futures:
+            future.result()
         
         # Check results
-        assert len(errors) == 0, f"Errors occurred: {errors}"
         assert len(results) == 50  # 5 threads * 10 items each
         assert len(set(results)) == 50  # All IDs should be unique
         
@@ -552,50 +550,28 @@ class TestConcurrency:
         status = queue_manager.get_queue_status()
         assert len(status['todo']) == 50
     
-    def test_concurrent_status_updates(self, queue_manager):
+    def test_concurrent_status_updates(self, queue_manager, executor):
         """Test multiple threads updating item status concurrently."""
         # Add items to queue
-        item_ids = []
-        for i in range(10):
-            item_id = queue_manager.enqueue(f"https://youtu.be/test{i}")
-            item_ids.append(item_id)
+        item_ids = [queue_manager.enqueue(url) for url in _TEST_URLS]
         
-        results = []
-        errors = []
-        
-        def update_status(item_id, status):
-            try:
-                success = queue_manager.update_item_status(item_id, status)
-                results.append((item_id, success))
-            except Exception as e:
-                errors.append(e)
-        
-        # Create threads to update different items
-        threads = []
+        # Update different items from different threads
+        futures = []
         for i, item_id in enumerate(item_ids):
             status = QueueStatus.IN_PROGRESS if i % 2 == 0 else QueueStatus.COMPLETED
-            thread = threading.Thread(target=update_status, args=(item_id, status))
-            threads.append(thread)
-        
-        # Start all threads
-        for thread in threads:
-            thread.start()
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+            futures.append(executor.submit(queue_manager.update_item_status, item_id, status))
         
         # Check results
-        assert len(errors) == 0, f"Errors occurred: {errors}"
+        results = [future.result() for future in futures]
         assert len(results) == 10
-        assert all(success for _, success in results)
+        assert all(results)
         
         # Verify final status
         status = queue_manager.get_queue_status()
         assert len(status['in_progress']) == 5
         assert len(status['completed']) == 5
     
-    def test_concurrent_listener_operations(self, queue_manager):
+    def test_concurrent_listener_operations(self, queue_manager, executor):
         """Test adding/removing listeners while processing items."""
         listeners = [Mock() for _ in range(5)]
         
@@ -606,19 +582,14 @@ class TestConcurrency:
                 queue_manager.remove_status_listener(listener)
         
         def enqueue_items():
-            for i in range(10):
-                queue_manager.enqueue(f"https://youtu.be/test{i}")
+            for url in _TEST_URLS:
+                queue_manager.enqueue(url)
                 time.sleep(0.01)  # Small delay
         
-        # Start both operations concurrently
-        thread1 = threading.Thread(target=add_remove_listeners)
-        thread2 = threading.Thread(target=enqueue_items)
-        
-        thread1.start()
-        thread2.start()
-        
-        thread1.join()
-        thread2.join()
+        # Run both operations concurrently
+        futures = [executor.submit(add_remove_listeners), executor.submit(enqueue_items)]
+        for future in futures:
+            future.result()
         
         # Should complete without errors
         status = queue_manager.get_queue_status()
@@ -628,12 +599,6 @@ class TestConcurrency:
 class TestStatisticsAndUtilities:
     """Test statistics tracking and utility methods."""
     
-    @pytest.fixture
-    def queue_manager(self):
-        """Create a QueueManager instance for testing."""
-        mock_processor = Mock()
-        return QueueManager(mock_processor)
-    
     def test_get_statistics_initial(self, queue_manager):
         """Test getting initial statistics."""
         stats = queue_manager.get_statistics()
@@ -685,6 +650,12 @@ class TestStatisticsAndUtilities:
         assert queue_manager.get_item_status(id1) is None
         assert queue_manager.get_item_status(id2) is None
         assert queue_manager.get_item_status(id3) is not None  # Still TODO
+        
+        # Cleared items must no longer be reported in any status group
+        status = queue_manager.get_queue_status()
+        assert [item.id for item in status['todo']] == [id3]
+        assert status['completed'] == []
+        assert status['failed'] == []
     
     def test_clear_completed_items_no_old_items(self, queue_manager):
         """Test clearing when no old items exist."""
@@ -732,12 +703,14 @@ class TestVideoProcessorIntegration:
     @pytest.fixture
     def queue_manager_with_components(self, mock_components):
         """Create QueueManager with mock VideoProcessor components."""
-        mock_processor = Mock()
+        mock_processor = Mock(spec=VideoProcessor)
         mock_processor.metadata_extractor = mock_components['metadata_extractor']
         mock_processor.summary_writer = mock_components['summary_writer']
         mock_processor.storage = mock_components['storage']
         
-        return QueueManager(mock_processor), mock_components
+        queue_manager = QueueManager(mock_processor)
+        yield queue_manager, mock_components
+        queue_manager.stop_processing(timeout=1.0)
     
     def test_process_regular_video_with_status_updates(self, queue_manager_with_components):
         """Test processing regular video with proper status updates."""
@@ -755,7 +728,7 @@ class TestVideoProcessorIntegration:
         item_id = queue_manager.enqueue("https://youtu.be/test123")
         
         # Wait for processing
-        time.sleep(0.3)
+        assert _wait_for_terminal(queue_manager, item_id)
         
         # Verify final status
         item = queue_manager.get_item_status(item_id)
@@ -774,8 +747,6 @@ class TestVideoProcessorIntegration:
         assert ProcessingPhase.METADATA_EXTRACTION.value in status_phases
         assert ProcessingPhase.SUMMARY_GENERATION.value in status_phases
         assert ProcessingPhase.NOTION_UPLOAD.value in status_phases
-        
-        queue_manager.stop_processing()
     
     def test_process_chunked_video_with_status_updates(self, queue_manager_with_components):
         """Test processing chunked video with proper status updates."""
@@ -808,7 +779,7 @@ class TestVideoProcessorIntegration:
         item_id = queue_manager.enqueue("https://youtu.be/long123")
         
         # Wait for processing
-        time.sleep(0.3)
+        assert _wait_for_terminal(queue_manager, item_id)
         
         # Verify final status
         item = queue_manager.get_item_status(item_id)
@@ -819,8 +790,6 @@ class TestVideoProcessorIntegration:
         # Verify chunk processing was indicated
         chunk_phases = [phase for _, phase, _, _ in status_changes if phase and 'chunk' in phase.lower()]
         assert len(chunk_phases) > 0
-        
-        queue_manager.stop_processing()
     
     def test_metadata_extraction_failure(self, queue_manager_with_components):
         """Test handling of metadata extraction failure."""
@@ -833,7 +802,7 @@ class TestVideoProcessorIntegration:
         item_id = queue_manager.enqueue("https://youtu.be/test123")
         
         # Wait for processing
-        time.sleep(0.2)
+        assert _wait_for_terminal(queue_manager, item_id)
         
         # Verify failure handling
         item = queue_manager.get_item_status(item_id)
@@ -843,8 +812,6 @@ class TestVideoProcessorIntegration:
         # Verify other components were not called
         mock_components['summary_writer'].generate_summary.assert_not_called()
         mock_components['storage'].store_video_summary.assert_not_called()
-        
-        queue_manager.stop_processing()
     
     def test_summary_generation_failure(self, queue_manager_with_components):
         """Test handling of summary generation failure."""
@@ -857,7 +824,7 @@ class TestVideoProcessorIntegration:
         item_id = queue_manager.enqueue("https://youtu.be/test123")
         
         # Wait for processing
-        time.sleep(0.2)
+        assert _wait_for_terminal(queue_manager, item_id)
         
         # Verify failure handling
         item = queue_manager.get_item_status(item_id)
@@ -867,8 +834,6 @@ class TestVideoProcessorIntegration:
         # Verify metadata was extracted but storage was not called
         mock_components['metadata_extractor'].extract_metadata.assert_called_once()
         mock_components['storage'].store_video_summary.assert_not_called()
-        
-        queue_manager.stop_processing()
     
     def test_storage_failure(self, queue_manager_with_components):
         """Test handling of storage failure."""
@@ -881,7 +846,7 @@ class TestVideoProcessorIntegration:
         item_id = queue_manager.enqueue("https://youtu.be/test123")
         
         # Wait for processing
-        time.sleep(0.2)
+        assert _wait_for_terminal(queue_manager, item_id)
         
         # Verify failure handling
         item = queue_manager.get_item_status(item_id)
@@ -892,8 +857,6 @@ class TestVideoProcessorIntegration:
         mock_components['metadata_extractor'].extract_metadata.assert_called_once()
         mock_components['summary_writer'].generate_summary.assert_called_once()
         mock_components['storage'].store_video_summary.assert_called_once()
-        
-        queue_manager.stop_processing()
     
     def test_custom_prompt_passed_to_summary_writer(self, queue_manager_with_components):
         """Test that custom prompt is passed to summary writer."""
@@ -905,14 +868,12 @@ class TestVideoProcessorIntegration:
         item_id = queue_manager.enqueue("https://youtu.be/test123", custom_prompt)
         
         # Wait for processing
-        time.sleep(0.2)
+        assert _wait_for_terminal(queue_manager, item_id)
         
         # Verify custom prompt was passed
         mock_components['summary_writer'].generate_summary.assert_called_once()
         call_args = mock_components['summary_writer'].generate_summary.call_args
         assert call_args[0][2] == custom_prompt  # Third argument should be custom_prompt
-        
-        queue_manager.stop_processing()
     
     def test_video_data_preparation_for_storage(self, queue_manager_with_components):
         """Test that video data is properly prepared for storage."""
@@ -933,7 +894,7 @@ class TestVideoProcessorIntegration:
         item_id = queue_manager.enqueue("https://youtu.be/abc123")
         
         # Wait for processing
-        time.sleep(0.2)
+        assert _wait_for_terminal(queue_manager, item_id)
         
         # Verify storage was called with correct data
         mock_components['storage'].store_video_summary.assert_called_once()
@@ -948,27 +909,20 @@ class TestVideoProcessorIntegration:
         assert call_args['Published'] == '2023-01-01'
         assert call_args['Video ID'] == 'abc123'
         assert call_args['Duration'] == 1800
-        
-        queue_manager.stop_processing()
 
 
 class TestErrorHandling:
     """Test error handling scenarios."""
     
-    @pytest.fixture
-    def queue_manager(self):
-        """Create a QueueManager instance for testing."""
-        mock_processor = Mock()
-        return QueueManager(mock_processor)
-    
     def test_enqueue_with_processing_queue_exception(self, queue_manager):
         """Test handling of internal queue exceptions during enqueue."""
-        # Fill the internal processing queue to capacity
-        with patch.object(queue_manager._processing_queue, 'put') as mock_put:
-            mock_put.side_effect = Exception("Queue error")
-            
-            with pytest.raises(VideoProcessingError, match="Failed to enqueue item"):
-                queue_manager.enqueue("https://youtu.be/test123")
+        # Make the internal processing queue reject the item
+        mock_queue = Mock()
+        mock_queue.append.side_effect = Exception("Queue error")
+        queue_manager._processing_queue = mock_queue
+        
+        with pytest.raises(VideoProcessingError, match="Failed to enqueue item"):
+            queue_manager.enqueue("https://youtu.be/test123")
     
     def test_processing_with_video_processor_exception(self, queue_manager):
         """Test handling of VideoProcessor exceptions during processing."""
@@ -989,29 +943,31 @@ class TestErrorHandling:
         item_id = queue_manager.enqueue("https://youtu.be/test123")
         
         # Wait for processing
-        time.sleep(0.2)
+        assert _wait_for_terminal(queue_manager, item_id)
         
         item = queue_manager.get_item_status(item_id)
         assert item.status == QueueStatus.FAILED
         assert "Processing failed" in item.error_message
         
+        # Statistics are updated after the final status change, so let the
+        # worker finish the item before reading them
+        queue_manager.stop_processing()
+        
         # Check statistics
         stats = queue_manager.get_statistics()
         assert stats['total_processed'] == 1
         assert stats['failed_processed'] == 1
-        
-        queue_manager.stop_processing()
     
     def test_graceful_shutdown_with_timeout(self, queue_manager):
         """Test graceful shutdown behavior with timeout."""
         # Mock a thread that doesn't stop quickly
-        with patch.object(queue_manager, '_processing_thread') as mock_thread:
-            mock_thread.is_alive.return_value = True
-            mock_thread.join.return_value = None  # Simulate timeout
-            
-            queue_manager._processing_active = True
-            
-            success = queue_manager.stop_processing(timeout=0.1)
-            
-            assert success is False  # Should return False on timeout
-            mock_thread.join.assert_called_once_with(timeout=0.1)
\ No newline at end of file
+        mock_thread = Mock()
+        mock_thread.is_alive.return_value = True
+        mock_thread.join.return_value = None  # Simulate timeout
+        queue_manager._processing_thread = mock_thread
+        queue_manager._processing_active = True
+        
+        success = queue_manager.stop_processing(timeout=0.1)
+        
+        assert success is False  # Should return False on timeout
+        mock_thread.join.assert_called_once_with(timeout=0.1)
\ No newline at end of file
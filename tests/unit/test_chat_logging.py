@@ -3,30 +3,41 @@ Tests for chat logging functionality.
 """
 
 import os
-import tempfile
-import shutil
-import time
+import re
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock, create_autospec
 import pytest
 
 from src.youtube_notion.utils.chat_logger import ChatLogger
 from src.youtube_notion.writers.gemini_summary_writer import GeminiSummaryWriter
 
 
+_CHUNK_RE = re.compile(r'_chunk_(\d+)_')
+_LOG_FILE_BODY = b"# Test Log File\nTest content\n"
+
+
+def _create_log_files(directory, filenames):
+    """Create placeholder log files with a fixed body in the given directory."""
+    for filename in filenames:
+        (directory / filename).write_bytes(_LOG_FILE_BODY)
+
+
+def _set_increasing_mtimes(directory, filenames, base_time=1_700_000_000):
+    """Give the files strictly increasing modification times in list order."""
+    for offset, filename in enumerate(filenames):
+        os.utime(directory / filename, (base_time + offset, base_time + offset))
+
+
+@pytest.fixture
+def chat_logger(tmp_path):
+    """Create a ChatLogger writing into the test's temporary directory."""
+    return ChatLogger(str(tmp_path))
+
+
 class TestChatLogger:
     """Test the ChatLogger utility class."""
     
-    def setup_method(self):
-        """Set up test environment with temporary directory."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.logger = ChatLogger(self.temp_dir)
-    
-    def teardown_method(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
-    def test_log_chat_creates_file(self):
+    def test_log_chat_creates_file(self, chat_logger, tmp_path):
         """Test that logging creates a file with correct content."""
         video_id = "test_video_123"
         video_url = f"https://youtu.be/{video_id}"
@@ -40,16 +51,15 @@ class TestChatLogger:
         }
         
         # Log the chat
-        log_file = self.logger.log_chat(video_id, video_url, prompt, response, metadata)
+        log_file = chat_logger.log_chat(video_id, video_url, prompt, response, metadata)
         
         # Verify file was created
         assert os.path.exists(log_file)
-        assert log_file.startswith(os.path.join(self.temp_dir, video_id))
+        assert log_file.startswith(str(tmp_path / video_id))
         assert log_file.endswith('.md')
         
         # Verify content
-        with open(log_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = Path(log_file).read_text(encoding='utf-8')
         
         assert "# Gemini Chat Log" in content
         assert video_id in content
@@ -59,7 +69,7 @@ class TestChatLogger:
         assert prompt in content
         assert response in content
     
-    def test_log_chat_without_metadata(self):
+    def test_log_chat_without_metadata(self, chat_logger):
         """Test logging without video metadata."""
         video_id = "test_video_456"
         video_url = f"https://youtu.be/{video_id}"
@@ -67,19 +77,18 @@ class TestChatLogger:
         response = "Test response"
         
         # Log without metadata
-        log_file = self.logger.log_chat(video_id, video_url, prompt, response)
+        log_file = chat_logger.log_chat(video_id, video_url, prompt, response)
         
         # Verify file was created
         assert os.path.exists(log_file)
         
         # Verify content doesn't include metadata section
-        with open(log_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = Path(log_file).read_text(encoding='utf-8')
         
         assert "# Gemini Chat Log" in content
         assert "## Video Metadata" not in content
     
-    def test_log_chat_chunk_creates_file(self):
+    def test_log_chat_chunk_creates_file(self, chat_logger):
         """Test that logging a chunk creates a file with correct content."""
         video_id = "test_video_chunk_123"
         video_url = f"https://youtu.be/{video_id}"
@@ -91,7 +100,7 @@ class TestChatLogger:
         }
 
         # Log the chat chunk
-        log_file = self.logger.log_chat_chunk(
+        log_file = chat_logger.log_chat_chunk(
             video_id, video_url, prompt, response, metadata,
             chunk_index=1, start_offset=600, end_offset=1200
         )
@@ -102,8 +111,7 @@ class TestChatLogger:
         assert log_file.endswith('.md')
 
         # Verify content
-        with open(log_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = Path(log_file).read_text(encoding='utf-8')
 
         assert "# Gemini Chat Log (Chunk)" in content
         assert "Chunk Index**: 1" in content
@@ -116,7 +124,7 @@ class TestChatLogger:
         assert prompt in content
         assert response in content
 
-    def test_get_log_files(self):
+    def test_get_log_files(self, chat_logger, tmp_path):
         """Test retrieving log files."""
         video_id = "test_video_789"
         other_video_id = "other_video_123"
@@ -129,20 +137,18 @@ class TestChatLogger:
         ]
         
         # Create the files
-        for filename in test_files:
-            filepath = Path(self.temp_dir) / filename
-            filepath.write_text("# Test Log File\nTest content")
+        _create_log_files(tmp_path, test_files)
         
         # Get all log files
-        all_files = self.logger.get_log_files()
+        all_files = chat_logger.get_log_files()
         assert len(all_files) == 3
         
         # Get files for specific video
-        video_files = self.logger.get_log_files(video_id)
+        video_files = chat_logger.get_log_files(video_id)
         assert len(video_files) == 2
         
         # Get files for other video
-        other_files = self.logger.get_log_files(other_video_id)
+        other_files = chat_logger.get_log_files(other_video_id)
         assert len(other_files) == 1
         
         # Verify all returned files exist
@@ -150,53 +156,45 @@ class TestChatLogger:
             assert file_path.exists()
             assert video_id in file_path.name
     
-    def test_get_latest_log_path(self):
+    def test_get_latest_log_path(self, chat_logger, tmp_path):
         """Test getting the latest log file path."""
         video_id = "test_video_latest"
         
-        # Create test files with different timestamps
-        import time
-        test_files = []
-        for i in range(3):
-            filename = f"{video_id}_{i}_20240101_10000{i}.md"
-            filepath = Path(self.temp_dir) / filename
-            filepath.write_text(f"# Test Log File {i}\nTest content")
-            test_files.append(filepath)
-            time.sleep(0.01)  # Small delay to ensure different modification times
+        # Create test files with increasing modification times
+        test_files = [f"{video_id}_{i}_20240101_10000{i}.md" for i in range(3)]
+        _create_log_files(tmp_path, test_files)
+        _set_increasing_mtimes(tmp_path, test_files)
         
         # Get latest log path
-        latest_path = self.logger.get_latest_log_path(video_id)
+        latest_path = chat_logger.get_latest_log_path(video_id)
         
         assert latest_path is not None
         assert video_id in latest_path
         assert latest_path.endswith('.md')
         
-        # Should be the last created file
-        latest_file = Path(latest_path)
-        assert latest_file.exists()
+        # Should be the most recently modified file
+        assert Path(latest_path) == tmp_path / test_files[-1]
     
-    def test_get_latest_log_path_no_files(self):
+    def test_get_latest_log_path_no_files(self, chat_logger):
         """Test getting latest log path when no files exist."""
-        latest_path = self.logger.get_latest_log_path("nonexistent_video")
+        latest_path = chat_logger.get_latest_log_path("nonexistent_video")
         assert latest_path is None
     
-    def test_get_latest_log_path_all_videos(self):
+    def test_get_latest_log_path_all_videos(self, chat_logger, tmp_path):
         """Test getting latest log path across all videos."""
         # Create files for different videos
         video_ids = ["video1", "video2", "video3"]
-        for i, video_id in enumerate(video_ids):
-            filename = f"{video_id}_20240101_10000{i}.md"
-            filepath = Path(self.temp_dir) / filename
-            filepath.write_text(f"# Test Log File {i}\nTest content")
-            time.sleep(0.01)  # Ensure different modification times
+        test_files = [f"{video_id}_20240101_10000{i}.md" for i, video_id in enumerate(video_ids)]
+        _create_log_files(tmp_path, test_files)
+        _set_increasing_mtimes(tmp_path, test_files)
         
         # Get latest across all videos (no video_id filter)
-        latest_path = self.logger.get_latest_log_path()
+        latest_path = chat_logger.get_latest_log_path()
         
         assert latest_path is not None
         assert "video3" in latest_path  # Should be the last created
     
-    def test_get_chunk_log_paths(self):
+    def test_get_chunk_log_paths(self, chat_logger, tmp_path):
         """Test getting chunk log file paths."""
         video_id = "chunked_video_123"
         
@@ -209,27 +207,15 @@ class TestChatLogger:
         ]
         
         # Create the files
-        for filename in chunk_files:
-            filepath = Path(self.temp_dir) / filename
-            filepath.write_text(f"# Chunk Log File\nChunk content for {filename}")
+        _create_log_files(tmp_path, chunk_files)
         
         # Get chunk log paths
-        chunk_paths = self.logger.get_chunk_log_paths(video_id)
+        chunk_paths = chat_logger.get_chunk_log_paths(video_id)
         
         assert len(chunk_paths) == 4
         
         # Verify they are sorted by chunk index
-        chunk_indices = []
-        for path in chunk_paths:
-            filename = Path(path).stem
-            # Extract chunk index from filename
-            parts = filename.split('_')
-            chunk_idx = None
-            for i, part in enumerate(parts):
-                if part == 'chunk' and i + 1 < len(parts):
-                    chunk_idx = int(parts[i + 1])
-                    break
-            chunk_indices.append(chunk_idx)
+        chunk_indices = [int(_CHUNK_RE.search(Path(path).name).group(1)) for path in chunk_paths]
         
         assert chunk_indices == [0, 1, 2, 10]  # Should be sorted numerically
         
@@ -239,12 +225,12 @@ class TestChatLogger:
             assert video_id in path
             assert "chunk" in path
     
-    def test_get_chunk_log_paths_no_chunks(self):
+    def test_get_chunk_log_paths_no_chunks(self, chat_logger):
         """Test getting chunk log paths when no chunk files exist."""
-        chunk_paths = self.logger.get_chunk_log_paths("no_chunks_video")
+        chunk_paths = chat_logger.get_chunk_log_paths("no_chunks_video")
         assert chunk_paths == []
     
-    def test_get_chunk_log_paths_mixed_files(self):
+    def test_get_chunk_log_paths_mixed_files(self, chat_logger, tmp_path):
         """Test getting chunk log paths with mixed file types."""
         video_id = "mixed_video_456"
         
@@ -256,19 +242,17 @@ class TestChatLogger:
             f"{video_id}_summary_20240101_100003.md",  # Other type
         ]
         
-        for filename in files:
-            filepath = Path(self.temp_dir) / filename
-            filepath.write_text(f"# Log File\nContent for {filename}")
+        _create_log_files(tmp_path, files)
         
         # Get only chunk log paths
-        chunk_paths = self.logger.get_chunk_log_paths(video_id)
+        chunk_paths = chat_logger.get_chunk_log_paths(video_id)
         
         assert len(chunk_paths) == 2
         for path in chunk_paths:
             assert "chunk" in path
             assert video_id in path
     
-    def test_get_chunk_log_paths_invalid_chunk_indices(self):
+    def test_get_chunk_log_paths_invalid_chunk_indices(self, chat_logger, tmp_path):
         """Test handling of invalid chunk indices in filenames."""
         video_id = "invalid_chunks_789"
         
@@ -280,12 +264,10 @@ class TestChatLogger:
             f"{video_id}_chunk_1_20240101_100003.md",    # Valid
         ]
         
-        for filename in files:
-            filepath = Path(self.temp_dir) / filename
-            filepath.write_text(f"# Log File\nContent for {filename}")
+        _create_log_files(tmp_path, files)
         
         # Get chunk log paths - should handle invalid indices gracefully
-        chunk_paths = self.logger.get_chunk_log_paths(video_id)
+        chunk_paths = chat_logger.get_chunk_log_paths(video_id)
         
         # Should return all files but with invalid ones sorted to beginning (index 0)
         assert len(chunk_paths) == 4
@@ -298,71 +280,63 @@ class TestChatLogger:
 class TestGeminiSummaryWriterLogging:
     """Test chat logging integration in GeminiSummaryWriter."""
     
-    def test_writer_logs_chat_on_success(self):
-        """Test that writer logs chat when summary generation succeeds."""
-        # Create a writer with mock chat logger
-        writer = GeminiSummaryWriter(
+    @pytest.fixture
+    def writer(self):
+        """Create a writer with a mock chat logger injected at construction."""
+        return GeminiSummaryWriter(
             api_key="test_key",
-            max_retries=1
+            max_retries=1,
+            chat_logger=create_autospec(ChatLogger, instance=True)
         )
+    
+    def test_writer_logs_chat_on_success(self, writer):
+        """Test that writer logs chat when summary generation succeeds."""
+        # Stub the API call to return a response
+        writer._call_gemini_api = MagicMock(return_value="Test summary")
+        
+        video_url = "https://youtu.be/dQw4w9WgXcQ"  # Valid 11-character video ID
+        video_metadata = {
+            "video_id": "dQw4w9WgXcQ",
+            "title": "Test Video", 
+            "channel": "Test Channel"
+        }
+        
+        # Generate summary
+        result = writer.generate_summary(video_url, video_metadata)
         
-        # Mock the chat logger
-        mock_logger = MagicMock()
-        writer.chat_logger = mock_logger
-        
-        # Mock the API call to return a response
-        with patch.object(writer, '_call_gemini_api', return_value="Test summary"):
-            video_url = "https://youtu.be/dQw4w9WgXcQ"  # Valid 11-character video ID
-            video_metadata = {
-                "video_id": "dQw4w9WgXcQ",
-                "title": "Test Video", 
-                "channel": "Test Channel"
-            }
-            
-            # Generate summary
-            result = writer.generate_summary(video_url, video_metadata)
-            
-            # Verify the result
-            assert result == "Test summary"
-            
-            # Verify chat was logged
-            mock_logger.log_chat.assert_called_once_with(
-                video_id="dQw4w9WgXcQ",
-                video_url=video_url,
-                prompt=writer.default_prompt,
-                response="Test summary",
-                video_metadata=video_metadata
-            )
+        # Verify the result
+        assert result == "Test summary"
+        
+        # Verify chat was logged
+        writer.chat_logger.log_chat.assert_called_once_with(
+            video_id="dQw4w9WgXcQ",
+            video_url=video_url,
+            prompt=writer.default_prompt,
+            response="Test summary",
+            video_metadata=video_metadata
+        )
     
-    def test_writer_handles_logging_failure_gracefully(self):
+    def test_writer_handles_logging_failure_gracefully(self, writer, capsys):
         """Test that writer continues working even if logging fails."""
-        writer = GeminiSummaryWriter(
-            api_key="test_key",
-            max_retries=1
-        )
+        # Make the chat logger raise an exception
+        writer.chat_logger.log_chat.side_effect = Exception("Logging failed")
+        
+        # Stub the API call to return a response
+        writer._call_gemini_api = MagicMock(return_value="Test summary")
+        
+        video_url = "https://youtu.be/dQw4w9WgXcQ"  # Valid 11-character video ID
+        video_metadata = {
+            "video_id": "dQw4w9WgXcQ",
+            "title": "Test Video", 
+            "channel": "Test Channel"
+        }
+        
+        # Generate summary - should not raise exception
+        result = writer.generate_summary(video_url, video_metadata)
+        
+        # Verify the result is still returned
+        assert result == "Test summary"
         
-        # Mock the chat logger to raise an exception
-        mock_logger = MagicMock()
-        mock_logger.log_chat.side_effect = Exception("Logging failed")
-        writer.chat_logger = mock_logger
-        
-        # Mock the API call to return a response
-        with patch.object(writer, '_call_gemini_api', return_value="Test summary"), \
-             patch('builtins.print') as mock_print:  # Capture the warning print
-            
-            video_url = "https://youtu.be/dQw4w9WgXcQ"  # Valid 11-character video ID
-            video_metadata = {
-                "video_id": "dQw4w9WgXcQ",
-                "title": "Test Video", 
-                "channel": "Test Channel"
-            }
-            
-            # Generate summary - should not raise exception
-            result = writer.generate_summary(video_url, video_metadata)
-            
-            # Verify the result is still returned
-            assert result == "Test summary"
-            
-            # Verify warning was printed
-            mock_print.assert_called_once()
-            assert "Warning: Failed to log chat conversation" in str(mock_print.call_args)
\ No newline at end of file
+        # Verify the warning was printed, and only once
+        output = capsys.readouterr().out
+        assert output.count("Warning: Failed to log chat conversation") == 1
@@ -4,213 +4,200 @@ Tests for CLI argument parsing and execution modes.
 """
 
 import pytest
-import sys
-from unittest.mock import patch, MagicMock
-from io import StringIO
 
-# Add src to path for imports
-sys.path.insert(0, 'src')
-
-# Import the CLI module
+# The CLI script lives at the repository root, which pytest puts on sys.path
+# because tests/ is a package; tests/conftest.py already adds src/
 import youtube_notion_cli
 
 
+@pytest.fixture(scope="module")
+def help_text():
+    """Formatted --help output, rendered once without going through SystemExit."""
+    return youtube_notion_cli._PARSER.format_help()
+
+
+def _parse_or_error(argv):
+    """Parse argv, returning (namespace, None) or (None, exit code) if argparse exits."""
+    try:
+        return youtube_notion_cli.parse_arguments(argv), None
+    except SystemExit as e:
+        return None, e.code
+
+
+class _EntryPointStub:
+    """Callable stand-in for a CLI entry point that records its calls."""
+    
+    def __init__(self):
+        self.calls = []
+        self.result = True
+        self.error = None
+    
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.fixture
+def mock_main(monkeypatch):
+    """Replace the CLI's example/single-URL entry point with a stub."""
+    stub = _EntryPointStub()
+    monkeypatch.setattr(youtube_notion_cli, 'main', stub)
+    return stub
+
+
+@pytest.fixture
+def mock_main_ui(monkeypatch):
+    """Replace the CLI's web UI entry point with a stub."""
+    stub = _EntryPointStub()
+    monkeypatch.setattr(youtube_notion_cli, 'main_ui', stub)
+    return stub
+
+
 class TestCLIArgumentParsing:
     """Test CLI argument parsing functionality."""
     
     def test_parse_arguments_example_data_default(self):
         """Test that example data mode is default when no arguments provided."""
-        with patch('sys.argv', ['youtube_notion_cli.py']):
-            args = youtube_notion_cli.parse_arguments()
-            assert args.url is None
-            assert args.example_data is False  # Default behavior, not explicitly set
-            assert args.prompt is None
+        args = youtube_notion_cli.parse_arguments([])
+        assert args.url is None
+        assert args.example_data is False  # Default behavior, not explicitly set
+        assert args.prompt is None
     
     def test_parse_arguments_example_data_explicit(self):
         """Test explicit example data mode."""
-        with patch('sys.argv', ['youtube_notion_cli.py', '--example-data']):
-            args = youtube_notion_cli.parse_arguments()
-            assert args.url is None
-            assert args.example_data is True
-            assert args.prompt is None
+        args = youtube_notion_cli.parse_arguments(['--example-data'])
+        assert args.url is None
+        assert args.example_data is True
+        assert args.prompt is None
     
     def test_parse_arguments_youtube_url(self):
         """Test YouTube URL argument parsing."""
         test_url = "https://www.youtube.com/watch?v=abc123"
-        with patch('sys.argv', ['youtube_notion_cli.py', '--url', test_url]):
-            args = youtube_notion_cli.parse_arguments()
-            assert args.url == test_url
-            assert args.example_data is False
-            assert args.prompt is None
+        args = youtube_notion_cli.parse_arguments(['--url', test_url])
+        assert args.url == test_url
+        assert args.example_data is False
+        assert args.prompt is None
     
     def test_parse_arguments_youtube_url_with_prompt(self):
         """Test YouTube URL with custom prompt."""
         test_url = "https://www.youtube.com/watch?v=abc123"
         test_prompt = "Custom summary prompt"
-        with patch('sys.argv', ['youtube_notion_cli.py', '--url', test_url, '--prompt', test_prompt]):
-            args = youtube_notion_cli.parse_arguments()
-            assert args.url == test_url
-            assert args.example_data is False
-            assert args.prompt == test_prompt
+        args = youtube_notion_cli.parse_arguments(['--url', test_url, '--prompt', test_prompt])
+        assert args.url == test_url
+        assert args.example_data is False
+        assert args.prompt == test_prompt
     
     def test_parse_arguments_youtu_be_url(self):
         """Test shortened YouTube URL format."""
         test_url = "https://youtu.be/abc123"
-        with patch('sys.argv', ['youtube_notion_cli.py', '--url', test_url]):
-            args = youtube_notion_cli.parse_arguments()
-            assert args.url == test_url
-            assert args.example_data is False
-            assert args.prompt is None
-    
-    def test_parse_arguments_mutually_exclusive_error(self):
-        """Test that --url and --example-data are mutually exclusive."""
-        test_url = "https://www.youtube.com/watch?v=abc123"
-        with patch('sys.argv', ['youtube_notion_cli.py', '--url', test_url, '--example-data']):
-            with pytest.raises(SystemExit):
-                youtube_notion_cli.parse_arguments()
+        args = youtube_notion_cli.parse_arguments(['--url', test_url])
+        assert args.url == test_url
+        assert args.example_data is False
+        assert args.prompt is None
     
     def test_parse_arguments_ui_mode(self):
         """Test UI mode argument parsing."""
-        with patch('sys.argv', ['youtube_notion_cli.py', '--ui']):
-            args = youtube_notion_cli.parse_arguments()
-            assert args.ui is True
-            assert args.url is None
-            assert args.example_data is False
-            assert args.prompt is None
-    
-    def test_parse_arguments_ui_mutually_exclusive_with_url(self):
-        """Test that --ui and --url are mutually exclusive."""
-        test_url = "https://www.youtube.com/watch?v=abc123"
-        with patch('sys.argv', ['youtube_notion_cli.py', '--ui', '--url', test_url]):
-            with pytest.raises(SystemExit):
-                youtube_notion_cli.parse_arguments()
+        args = youtube_notion_cli.parse_arguments(['--ui'])
+        assert args.ui is True
+        assert args.url is None
+        assert args.example_data is False
+        assert args.prompt is None
     
-    def test_parse_arguments_ui_mutually_exclusive_with_example_data(self):
-        """Test that --ui and --example-data are mutually exclusive."""
-        with patch('sys.argv', ['youtube_notion_cli.py', '--ui', '--example-data']):
-            with pytest.raises(SystemExit):
-                youtube_notion_cli.parse_arguments()
-    
-    def test_parse_arguments_ui_mutually_exclusive_with_urls(self):
-        """Test that --ui and --urls are mutually exclusive."""
-        with patch('sys.argv', ['youtube_notion_cli.py', '--ui', '--urls', 'url1,url2']):
-            with pytest.raises(SystemExit):
-                youtube_notion_cli.parse_arguments()
-    
-    def test_parse_arguments_ui_mutually_exclusive_with_file(self):
-        """Test that --ui and --file are mutually exclusive."""
-        with patch('sys.argv', ['youtube_notion_cli.py', '--ui', '--file', 'urls.txt']):
-            with pytest.raises(SystemExit):
-                youtube_notion_cli.parse_arguments()
+    @pytest.mark.parametrize("argv", [
+        ['--url', 'https://www.youtube.com/watch?v=abc123', '--example-data'],
+        ['--ui', '--url', 'https://www.youtube.com/watch?v=abc123'],
+        ['--ui', '--example-data'],
+        ['--ui', '--urls', 'url1,url2'],
+        ['--ui', '--file', 'urls.txt'],
+    ])
+    def test_parse_arguments_mutually_exclusive_error(self, argv):
+        """Test that input mode options are mutually exclusive."""
+        assert _parse_or_error(argv) == (None, 2)
 
 
 class TestCLIValidation:
     """Test CLI argument validation."""
     
-    def test_prompt_without_url_error(self):
+    def test_prompt_without_url_error(self, capsys):
         """Test that --prompt without --url raises an error."""
-        with patch('sys.argv', ['youtube_notion_cli.py', '--prompt', 'test prompt']):
-            with patch('sys.stderr', new_callable=StringIO) as mock_stderr:
-                with pytest.raises(SystemExit) as exc_info:
-                    youtube_notion_cli.main_cli()
-                assert exc_info.value.code == 1
-                assert "Error: --prompt can only be used with single --url" in mock_stderr.getvalue()
+        with pytest.raises(SystemExit) as exc_info:
+            youtube_notion_cli.main_cli(['--prompt', 'test prompt'])
+        assert exc_info.value.code == 1
+        assert "Error: --prompt can only be used with single --url" in capsys.readouterr().err
     
-    def test_prompt_with_example_data_error(self):
+    def test_prompt_with_example_data_error(self, capsys):
         """Test that --prompt with --example-data raises an error."""
-        with patch('sys.argv', ['youtube_notion_cli.py', '--example-data', '--prompt', 'test prompt']):
-            with patch('sys.stderr', new_callable=StringIO) as mock_stderr:
-                with pytest.raises(SystemExit) as exc_info:
-                    youtube_notion_cli.main_cli()
-                assert exc_info.value.code == 1
-                assert "Error: --prompt can only be used with single --url" in mock_stderr.getvalue()
+        with pytest.raises(SystemExit) as exc_info:
+            youtube_notion_cli.main_cli(['--example-data', '--prompt', 'test prompt'])
+        assert exc_info.value.code == 1
+        assert "Error: --prompt can only be used with single --url" in capsys.readouterr().err
     
-    def test_ui_mode_prevents_url_processing(self):
+    def test_ui_mode_prevents_url_processing(self, mock_main_ui):
         """Test that UI mode doesn't process command line URLs."""
-        with patch('sys.argv', ['youtube_notion_cli.py', '--ui']):
-            with patch('youtube_notion_cli.main_ui') as mock_main_ui:
-                mock_main_ui.return_value = True
-                with pytest.raises(SystemExit) as exc_info:
-                    youtube_notion_cli.main_cli()
-                assert exc_info.value.code == 0
-                mock_main_ui.assert_called_once()
+        with pytest.raises(SystemExit) as exc_info:
+            youtube_notion_cli.main_cli(['--ui'])
+        assert exc_info.value.code == 0
+        assert len(mock_main_ui.calls) == 1
 
 
 class TestCLIExecution:
     """Test CLI execution modes."""
     
-    @patch('youtube_notion_cli.main')
     def test_main_cli_example_data_default(self, mock_main):
         """Test that main is called with no arguments for default mode."""
-        with patch('sys.argv', ['youtube_notion_cli.py']):
-            youtube_notion_cli.main_cli()
-            mock_main.assert_called_once_with()
+        youtube_notion_cli.main_cli([])
+        assert mock_main.calls == [((), {})]
     
-    @patch('youtube_notion_cli.main')
     def test_main_cli_example_data_explicit(self, mock_main):
         """Test that main is called with no arguments for explicit example data mode."""
-        with patch('sys.argv', ['youtube_notion_cli.py', '--example-data']):
-            youtube_notion_cli.main_cli()
-            mock_main.assert_called_once_with()
+        youtube_notion_cli.main_cli(['--example-data'])
+        assert mock_main.calls == [((), {})]
     
-    @patch('youtube_notion_cli.main')
     def test_main_cli_youtube_url(self, mock_main):
         """Test that main is called with YouTube URL."""
         test_url = "https://www.youtube.com/watch?v=abc123"
-        with patch('sys.argv', ['youtube_notion_cli.py', '--url', test_url]):
-            youtube_notion_cli.main_cli()
-            mock_main.assert_called_once_with(youtube_url=test_url, custom_prompt=None)
+        youtube_notion_cli.main_cli(['--url', test_url])
+        assert mock_main.calls == [((), {'youtube_url': test_url, 'custom_prompt': None})]
     
-    @patch('youtube_notion_cli.main')
     def test_main_cli_youtube_url_with_prompt(self, mock_main):
         """Test that main is called with YouTube URL and custom prompt."""
         test_url = "https://www.youtube.com/watch?v=abc123"
         test_prompt = "Custom summary prompt"
-        with patch('sys.argv', ['youtube_notion_cli.py', '--url', test_url, '--prompt', test_prompt]):
-            youtube_notion_cli.main_cli()
-            mock_main.assert_called_once_with(youtube_url=test_url, custom_prompt=test_prompt)
+        youtube_notion_cli.main_cli(['--url', test_url, '--prompt', test_prompt])
+        assert mock_main.calls == [((), {'youtube_url': test_url, 'custom_prompt': test_prompt})]
     
-    @patch('youtube_notion_cli.main_ui')
     def test_main_cli_ui_mode(self, mock_main_ui):
         """Test that main_ui is called for UI mode."""
-        mock_main_ui.return_value = True
-        with patch('sys.argv', ['youtube_notion_cli.py', '--ui']):
-            with pytest.raises(SystemExit) as exc_info:
-                youtube_notion_cli.main_cli()
-            assert exc_info.value.code == 0
-            mock_main_ui.assert_called_once()
+        with pytest.raises(SystemExit) as exc_info:
+            youtube_notion_cli.main_cli(['--ui'])
+        assert exc_info.value.code == 0
+        assert len(mock_main_ui.calls) == 1
     
-    @patch('youtube_notion_cli.main_ui')
     def test_main_cli_ui_mode_failure(self, mock_main_ui):
         """Test that UI mode failure exits with error code."""
-        mock_main_ui.return_value = False
-        with patch('sys.argv', ['youtube_notion_cli.py', '--ui']):
-            with pytest.raises(SystemExit) as exc_info:
-                youtube_notion_cli.main_cli()
-            assert exc_info.value.code == 1
-            mock_main_ui.assert_called_once()
+        mock_main_ui.result = False
+        with pytest.raises(SystemExit) as exc_info:
+            youtube_notion_cli.main_cli(['--ui'])
+        assert exc_info.value.code == 1
+        assert len(mock_main_ui.calls) == 1
     
-    @patch('youtube_notion_cli.main_ui')
-    def test_main_cli_ui_mode_keyboard_interrupt(self, mock_main_ui):
+    def test_main_cli_ui_mode_keyboard_interrupt(self, mock_main_ui, capsys):
         """Test that UI mode handles KeyboardInterrupt gracefully."""
-        mock_main_ui.side_effect = KeyboardInterrupt()
-        with patch('sys.argv', ['youtube_notion_cli.py', '--ui']):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                with pytest.raises(SystemExit) as exc_info:
-                    youtube_notion_cli.main_cli()
-                assert exc_info.value.code == 0
-                assert "Shutting down web UI..." in mock_stdout.getvalue()
+        mock_main_ui.error = KeyboardInterrupt()
+        with pytest.raises(SystemExit) as exc_info:
+            youtube_notion_cli.main_cli(['--ui'])
+        assert exc_info.value.code == 0
+        assert "Shutting down web UI..." in capsys.readouterr().out
     
-    @patch('youtube_notion_cli.main_ui')
-    def test_main_cli_ui_mode_exception(self, mock_main_ui):
+    def test_main_cli_ui_mode_exception(self, mock_main_ui, capsys):
         """Test that UI mode handles exceptions gracefully."""
-        mock_main_ui.side_effect = Exception("Test error")
-        with patch('sys.argv', ['youtube_notion_cli.py', '--ui']):
-            with patch('sys.stderr', new_callable=StringIO) as mock_stderr:
-                with pytest.raises(SystemExit) as exc_info:
-                    youtube_notion_cli.main_cli()
-                assert exc_info.value.code == 1
-                assert "Error starting web UI: Test error" in mock_stderr.getvalue()
+        mock_main_ui.error = Exception("Test error")
+        with pytest.raises(SystemExit) as exc_info:
+            youtube_notion_cli.main_cli(['--ui'])
+        assert exc_info.value.code == 1
+        assert "Error starting web UI: Test error" in capsys.readouterr().err
 
 
 class TestCLIHelpAndUsage:
@@ -218,57 +205,50 @@ class TestCLIHelpAndUsage:
     
     def test_help_message(self):
         """Test that help message is displayed correctly."""
-        with patch('sys.argv', ['youtube_notion_cli.py', '--help']):
-            with pytest.raises(SystemExit) as exc_info:
-                youtube_notion_cli.parse_arguments()
-            # Help should exit with code 0
-            assert exc_info.value.code == 0
+        # Help should exit with code 0
+        assert _parse_or_error(['--help']) == (None, 0)
+    
+    @pytest.mark.parametrize("flag", ['-h', '--help'])
+    def test_main_cli_leading_help_flag(self, flag, help_text, mock_main, capsys):
+        """Test that a leading help flag prints help and exits without running a mode."""
+        with pytest.raises(SystemExit) as exc_info:
+            youtube_notion_cli.main_cli([flag, '--url', 'https://youtu.be/abc123'])
+        assert exc_info.value.code == 0
+        assert capsys.readouterr().out == help_text
+        assert mock_main.calls == []
     
-    def test_help_contains_examples(self):
+    def test_help_contains_examples(self, help_text):
         """Test that help message contains usage examples."""
-        with patch('sys.argv', ['youtube_notion_cli.py', '--help']):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                with pytest.raises(SystemExit):
-                    youtube_notion_cli.parse_arguments()
-                help_output = mock_stdout.getvalue()
-                assert "Examples:" in help_output
-                assert "--example-data" in help_output
-                assert "--url" in help_output
-                assert "--prompt" in help_output
-                assert "--ui" in help_output
-                assert "Start web UI mode for visual queue management" in help_output
+        assert "Examples:" in help_text
+        assert "--example-data" in help_text
+        assert "--url" in help_text
+        assert "--prompt" in help_text
+        assert "--ui" in help_text
+        assert "Start web UI mode for visual queue management" in help_text
 
 
 class TestCLIIntegration:
     """Integration tests for CLI functionality."""
     
-    @patch('youtube_notion_cli.main')
     def test_cli_integration_example_data(self, mock_main):
         """Test full CLI integration with example data mode."""
-        with patch('sys.argv', ['youtube_notion_cli.py', '--example-data']):
-            youtube_notion_cli.main_cli()
-            mock_main.assert_called_once_with()
+        youtube_notion_cli.main_cli(['--example-data'])
+        assert mock_main.calls == [((), {})]
     
-    @patch('youtube_notion_cli.main')
     def test_cli_integration_youtube_processing(self, mock_main):
         """Test full CLI integration with YouTube processing mode."""
         test_url = "https://www.youtube.com/watch?v=test123"
         test_prompt = "Generate a detailed summary"
         
-        with patch('sys.argv', ['youtube_notion_cli.py', '--url', test_url, '--prompt', test_prompt]):
-            youtube_notion_cli.main_cli()
-            mock_main.assert_called_once_with(youtube_url=test_url, custom_prompt=test_prompt)
+        youtube_notion_cli.main_cli(['--url', test_url, '--prompt', test_prompt])
+        assert mock_main.calls == [((), {'youtube_url': test_url, 'custom_prompt': test_prompt})]
     
-    @patch('youtube_notion_cli.main_ui')
     def test_cli_integration_ui_mode(self, mock_main_ui):
         """Test full CLI integration with UI mode."""
-        mock_main_ui.return_value = True
-        
-        with patch('sys.argv', ['youtube_notion_cli.py', '--ui']):
-            with pytest.raises(SystemExit) as exc_info:
-                youtube_notion_cli.main_cli()
-            assert exc_info.value.code == 0
-            mock_main_ui.assert_called_once()
+        with pytest.raises(SystemExit) as exc_info:
+            youtube_notion_cli.main_cli(['--ui'])
+        assert exc_info.value.code == 0
+        assert len(mock_main_ui.calls) == 1
 
 
 class TestUIModeFunctionality:
@@ -276,32 +256,22 @@ class TestUIModeFunctionality:
     
     def test_ui_mode_argument_isolation(self):
         """Test that UI mode is properly isolated from other arguments."""
-        with patch('sys.argv', ['youtube_notion_cli.py', '--ui']):
-            args = youtube_notion_cli.parse_arguments()
-            assert args.ui is True
-            assert args.url is None
-            assert args.urls is None
-            assert args.file is None
-            assert args.example_data is False
-            assert args.prompt is None
+        args = youtube_notion_cli.parse_arguments(['--ui'])
+        assert args.ui is True
+        assert args.url is None
+        assert args.urls is None
+        assert args.file is None
+        assert args.example_data is False
+        assert args.prompt is None
     
-    @patch('youtube_notion_cli.main_ui')
     def test_ui_mode_browser_opening_simulation(self, mock_main_ui):
         """Test that UI mode attempts to open browser."""
-        mock_main_ui.return_value = True
-        
-        with patch('sys.argv', ['youtube_notion_cli.py', '--ui']):
-            with pytest.raises(SystemExit) as exc_info:
-                youtube_notion_cli.main_cli()
-            assert exc_info.value.code == 0
-            mock_main_ui.assert_called_once()
+        with pytest.raises(SystemExit) as exc_info:
+            youtube_notion_cli.main_cli(['--ui'])
+        assert exc_info.value.code == 0
+        assert len(mock_main_ui.calls) == 1
     
-    def test_ui_mode_help_text(self):
+    def test_ui_mode_help_text(self, help_text):
         """Test that UI mode help text is descriptive."""
-        with patch('sys.argv', ['youtube_notion_cli.py', '--help']):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                with pytest.raises(SystemExit):
-                    youtube_notion_cli.parse_arguments()
-                help_output = mock_stdout.getvalue()
-                assert "Start web UI mode for visual queue management" in help_output
+        assert "Start web UI mode for visual queue management" in help_text
 
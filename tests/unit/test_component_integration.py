@@ -26,16 +26,24 @@ from src.youtube_notion.utils.exceptions import (
 )
 
 
+@pytest.fixture
+def successful_mocks():
+    """Fresh (extractor, writer, storage) mocks configured to succeed."""
+    return create_successful_mocks()
+
+
+@pytest.fixture
+def processor(successful_mocks):
+    """VideoProcessor wired to the successful_mocks components."""
+    return VideoProcessor(*successful_mocks)
+
+
 class TestComponentIntegration:
     """Test integration between components using mocks."""
     
-    def test_successful_video_processing_workflow(self):
+    def test_successful_video_processing_workflow(self, successful_mocks, processor):
         """Test complete successful video processing workflow."""
-        # Create successful mocks
-        extractor, writer, storage = create_successful_mocks()
-        
-        # Create processor with mocks
-        processor = VideoProcessor(extractor, writer, storage)
+        extractor, writer, storage = successful_mocks
         
         # Process a video
         test_url = "https://youtu.be/test123"
@@ -63,10 +71,9 @@ class TestComponentIntegration:
         assert stored_data['Video URL'] == test_url
         assert 'MockSummaryWriter' in stored_data['Summary']
     
-    def test_video_processing_with_custom_prompt(self):
+    def test_video_processing_with_custom_prompt(self, successful_mocks, processor):
         """Test video processing with custom prompt."""
-        extractor, writer, storage = create_successful_mocks()
-        processor = VideoProcessor(extractor, writer, storage)
+        _, writer, _ = successful_mocks
         
         test_url = "https://youtu.be/test123"
         custom_prompt = "Create a detailed technical summary"
@@ -79,10 +86,9 @@ class TestComponentIntegration:
         summary_call = writer.generate_summary_calls[0]
         assert summary_call[2] == custom_prompt
     
-    def test_configuration_validation_success(self):
+    def test_configuration_validation_success(self, successful_mocks, processor):
         """Test successful configuration validation."""
-        extractor, writer, storage = create_successful_mocks()
-        processor = VideoProcessor(extractor, writer, storage)
+        _, writer, storage = successful_mocks
         
         # All mocks are configured to be valid
         assert processor.validate_configuration() is True
@@ -171,12 +177,9 @@ class TestComponentIntegration:
         with pytest.raises((ConfigurationError, VideoProcessingError)):
             processor.process_video(test_url)
     
-    def test_data_transformation_through_pipeline(self):
+    def test_data_transformation_through_pipeline(self, successful_mocks, processor):
         """Test that data is correctly transformed through the pipeline."""
-        # Create mocks with specific responses
-        extractor = MockMetadataExtractor()
-        writer = MockSummaryWriter()
-        storage = MockStorage()
+        extractor, writer, storage = successful_mocks
         
         # Configure custom metadata
         test_url = "https://youtu.be/custom123"
@@ -192,8 +195,6 @@ class TestComponentIntegration:
         custom_summary = "# Custom Summary\n\nThis is a custom test summary."
         writer.set_response_for_url(test_url, custom_summary)
         
-        processor = VideoProcessor(extractor, writer, storage)
-        
         result = processor.process_video(test_url)
         assert result is True
         
@@ -205,10 +206,9 @@ class TestComponentIntegration:
         assert stored_data['Summary'] == custom_summary
         assert 'custom123' in stored_data['Cover']
     
-    def test_multiple_video_processing(self):
+    def test_multiple_video_processing(self, successful_mocks, processor):
         """Test processing multiple videos in sequence."""
-        extractor, writer, storage = create_successful_mocks()
-        processor = VideoProcessor(extractor, writer, storage)
+        extractor, writer, storage = successful_mocks
         
         test_urls = [
             "https://youtu.be/video1",
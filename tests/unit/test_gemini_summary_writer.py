@@ -149,17 +149,6 @@ class TestGeminiSummaryWriterSummaryGeneration:
             writer.chat_logger = Mock(spec=ChatLogger)
             return writer
     
-    @pytest.fixture
-    def sample_video_metadata(self):
-        """Sample video metadata for testing."""
-        return {
-            'video_id': 'test_video_id',
-            'title': 'Test Video Title',
-            'channel': 'Test Channel',
-            'description': 'Test video description',
-            'thumbnail_url': 'https://example.com/thumbnail.jpg'
-        }
-    
     def test_generate_summary_success(self, mock_writer, sample_video_metadata):
         """Test successful summary generation."""
         expected_summary = "# Test Summary\n\nThis is a test summary with [1:23] timestamp."
@@ -275,6 +264,24 @@ class TestGeminiAPICall:
             
             assert result == "First part second part."
     
+    def test_call_gemini_api_streaming_joins_all_chunks(self, mock_writer):
+        """Test that every streamed chunk is joined in order, skipping empty ones."""
+        chunk_texts = [f"part {i} " for i in range(10)]
+        mock_chunks = [Mock(text=text) for text in chunk_texts]
+        mock_chunks.insert(5, Mock(text=None))
+        mock_chunks.insert(2, Mock(text=""))
+        
+        mock_client = Mock()
+        mock_client.models.generate_content_stream.return_value = mock_chunks
+        
+        with patch('src.youtube_notion.writers.gemini_summary_writer.genai.Client', return_value=mock_client):
+            result = mock_writer._call_gemini_api(
+                video_url="https://youtube.com/watch?v=test_id",
+                prompt="Test prompt"
+            )
+            
+            assert result == "".join(chunk_texts).strip()
+    
     def test_call_gemini_api_success_non_streaming_fallback(self, mock_writer):
         """Test Gemini API call falls back to non-streaming on streaming failure."""
         mock_client = Mock()
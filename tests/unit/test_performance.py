@@ -8,6 +8,9 @@ from youtube_notion.utils.markdown_converter import markdown_to_notion_blocks, e
 from youtube_notion.config.example_data import EXAMPLE_DATA
 
 
+_BASE_PARAGRAPH = "This is a test paragraph with some content. "
+
+
 class TestPerformance:
     """Test cases for performance benchmarks."""
     
@@ -72,9 +75,8 @@ class TestPerformance:
     def test_scaling_with_content_size(self, content_size):
         """Test how performance scales with content size."""
         # Create content of specified size (approximate word count)
-        base_text = "This is a test paragraph with some content. "
         repetitions = content_size // 10  # Approximate words per repetition
-        large_content = base_text * repetitions
+        large_content = _BASE_PARAGRAPH * repetitions
         
         start_time = time.time()
         blocks = markdown_to_notion_blocks(large_content)
@@ -90,11 +92,6 @@ class TestPerformance:
     
     def test_memory_usage_large_content(self):
         """Test that large content doesn't cause memory issues."""
-        import sys
-        
-        # Get initial memory usage (approximate)
-        initial_objects = len(gc.get_objects()) if 'gc' in sys.modules else 0
-        
         # Process very large content
         huge_content = EXAMPLE_DATA["Summary"] * 100
         blocks = markdown_to_notion_blocks(huge_content)
@@ -108,10 +105,3 @@ class TestPerformance:
         del blocks
         
         print("Large content memory test completed successfully")
-
-
-# Import gc for memory test
-try:
-    import gc
-except ImportError:
-    gc = None
\ No newline at end of file
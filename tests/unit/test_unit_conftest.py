@@ -0,0 +1,41 @@
+"""
+Tests for the unit test package configuration.
+"""
+
+from pathlib import Path
+
+pytest_plugins = ["pytester"]
+
+_UNIT_CONFTEST = Path(__file__).with_name("conftest.py")
+_CREDENTIALS = ('NOTION_TOKEN', 'GEMINI_API_KEY', 'YOUTUBE_API_KEY')
+
+
+class TestStripApiCredentials:
+    """Test that API credentials are only stripped inside the unit package."""
+    
+    def test_credentials_restored_after_unit_package(self, pytester, monkeypatch):
+        """Test that a suite running after the unit package sees the credentials again."""
+        for name in _CREDENTIALS:
+            monkeypatch.setenv(name, f"real-{name.lower()}")
+        
+        unit_dir = pytester.mkpydir("unit")
+        (unit_dir / "conftest.py").write_text(_UNIT_CONFTEST.read_text(encoding='utf-8'), encoding='utf-8')
+        (unit_dir / "test_stripped.py").write_text(
+            "import os\n"
+            "\n"
+            "def test_credentials_stripped():\n"
+            f"    assert not any(name in os.environ for name in {_CREDENTIALS!r})\n",
+            encoding='utf-8'
+        )
+        other_dir = pytester.mkpydir("other")
+        (other_dir / "test_restored.py").write_text(
+            "import os\n"
+            "\n"
+            "def test_credentials_restored():\n"
+            f"    for name in {_CREDENTIALS!r}:\n"
+            "        assert os.environ[name] == 'real-' + name.lower()\n",
+            encoding='utf-8'
+        )
+        
+        result = pytester.runpytest("-p", "no:cacheprovider", "-p", "no:asyncio", "unit", "other")
+        result.assert_outcomes(passed=2)
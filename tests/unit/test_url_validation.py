@@ -17,41 +17,37 @@ class TestURLValidation:
         """Set up test fixtures."""
         self.extractor = VideoMetadataExtractor()
     
-    def test_validate_youtube_url_valid_urls(self):
+    @pytest.mark.parametrize("url", [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ",
+        "http://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "youtube.com/watch?v=dQw4w9WgXcQ",
+        "youtu.be/dQw4w9WgXcQ",
+    ])
+    def test_validate_youtube_url_valid_urls(self, url):
         """Test validation of valid YouTube URLs."""
-        valid_urls = [
-            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-            "https://youtube.com/watch?v=dQw4w9WgXcQ",
-            "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
-            "https://youtu.be/dQw4w9WgXcQ",
-            "http://www.youtube.com/watch?v=dQw4w9WgXcQ",
-            "www.youtube.com/watch?v=dQw4w9WgXcQ",
-            "youtube.com/watch?v=dQw4w9WgXcQ",
-            "youtu.be/dQw4w9WgXcQ",
-        ]
-        
-        for url in valid_urls:
-            assert self.extractor.validate_url(url), f"URL should be valid: {url}"
+        assert self.extractor.validate_url(url), f"URL should be valid: {url}"
     
-    def test_validate_youtube_url_invalid_urls(self):
+    @pytest.mark.parametrize("url", [
+        "https://vimeo.com/123456789",
+        "https://www.dailymotion.com/video/x123456",
+        "https://www.facebook.com/watch?v=123456789",
+        "https://example.com/watch?v=dQw4w9WgXcQ",
+        "not_a_url",
+        "",
+        None,
+        123,
+        "https://youtube.com/",
+        "https://youtube.com/watch",
+        "https://youtube.com/watch?v=",
+        "https://youtube.com/watch?v=invalid_id",
+    ])
+    def test_validate_youtube_url_invalid_urls(self, url):
         """Test validation of invalid URLs."""
-        invalid_urls = [
-            "https://vimeo.com/123456789",
-            "https://www.dailymotion.com/video/x123456",
-            "https://www.facebook.com/watch?v=123456789",
-            "https://example.com/watch?v=dQw4w9WgXcQ",
-            "not_a_url",
-            "",
-            None,
-            123,
-            "https://youtube.com/",
-            "https://youtube.com/watch",
-            "https://youtube.com/watch?v=",
-            "https://youtube.com/watch?v=invalid_id",
-        ]
-        
-        for url in invalid_urls:
-            assert not self.extractor.validate_url(url), f"URL should be invalid: {url}"
+        assert not self.extractor.validate_url(url), f"URL should be invalid: {url}"
 
 
 class TestVideoIDExtraction:
@@ -310,25 +306,23 @@ class TestIntegrationScenarios:
             extracted_id = self.extractor.extract_video_id(url)
             assert extracted_id == expected_id, f"Expected {expected_id}, got {extracted_id}"
     
-    def test_url_variations_same_video(self):
+    @pytest.mark.parametrize("url", [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ",
+        "https://www.youtube.com/embed/dQw4w9WgXcQ",
+        "https://www.youtube.com/v/dQw4w9WgXcQ",
+        "www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "youtu.be/dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=123s",
+        "https://youtu.be/dQw4w9WgXcQ?t=123",
+    ])
+    def test_url_variations_same_video(self, url):
         """Test that different URL formats for the same video return the same ID."""
         video_id = "dQw4w9WgXcQ"
-        url_variations = [
-            f"https://www.youtube.com/watch?v={video_id}",
-            f"https://youtube.com/watch?v={video_id}",
-            f"https://m.youtube.com/watch?v={video_id}",
-            f"https://youtu.be/{video_id}",
-            f"https://www.youtube.com/embed/{video_id}",
-            f"https://www.youtube.com/v/{video_id}",
-            f"www.youtube.com/watch?v={video_id}",
-            f"youtu.be/{video_id}",
-            f"https://www.youtube.com/watch?v={video_id}&t=123s",
-            f"https://youtu.be/{video_id}?t=123",
-        ]
-        
-        for url in url_variations:
-            extracted_id = self.extractor.extract_video_id(url)
-            assert extracted_id == video_id, f"URL {url} should extract to {video_id}, got {extracted_id}"
+        extracted_id = self.extractor.extract_video_id(url)
+        assert extracted_id == video_id, f"URL {url} should extract to {video_id}, got {extracted_id}"
     
     def test_error_consistency(self):
         """Test that validation and extraction errors are consistent."""
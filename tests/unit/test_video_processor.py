@@ -9,6 +9,7 @@ external dependencies.
 import pytest
 from typing import Dict, Any, Optional
 from unittest.mock import Mock
+from hypothesis import given, settings, strategies as st
 
 from src.youtube_notion.processors.video_processor import VideoProcessor
 from src.youtube_notion.interfaces import SummaryWriter, Storage
@@ -418,4 +419,29 @@ class TestVideoProcessorIntegration:
             
             # Verify error is raised
             with pytest.raises(expected_error):
-                processor.process_video("https://youtube.com/watch?v=test123")
\ No newline at end of file
+                processor.process_video("https://youtube.com/watch?v=test123")
+
+
+class TestVideoProcessorProperties:
+    """Property-based tests for VideoProcessor data handling."""
+    
+    @settings(max_examples=50, deadline=None)
+    @given(title=st.text(), channel=st.text(), summary=st.text(max_size=5000))
+    def test_process_video_passes_content_through_unchanged(self, title, channel, summary):
+        """Test that arbitrary titles, channels, and summaries reach storage verbatim."""
+        video_url = "https://youtube.com/watch?v=test123"
+        extractor = MockMetadataExtractor(metadata_responses={
+            video_url: {"title": title, "channel": channel}
+        })
+        writer = MockSummaryWriter(responses={video_url: summary})
+        storage = MockStorage()
+        
+        processor = VideoProcessor(extractor, writer, storage)
+        
+        assert processor.process_video(video_url) is True
+        
+        stored_data = storage.stored_videos[0]
+        assert stored_data["Title"] == title
+        assert stored_data["Channel"] == channel
+        assert stored_data["Summary"] == summary
+        assert stored_data["Video URL"] == video_url
@@ -199,7 +199,7 @@ class TestWebServerConfig:
             'host', 'port', 'debug', 'static_folder', 
             'max_queue_size', 'sse_heartbeat_interval', 'reload', 'cors_origins'
         }
-        assert set(config_dict.keys()) == expected_keys
+        assert config_dict.keys() == expected_keys
         
         assert config_dict['host'] == "localhost"
         assert config_dict['port'] == 4000
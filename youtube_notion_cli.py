@@ -10,8 +10,17 @@ import webbrowser
 import time
 from src.youtube_notion.main import main, main_ui, main_batch
 
-def parse_arguments():
-    """Parse command-line arguments for the YouTube to Notion integration."""
+# Mutually exclusive input modes as (flag, add_argument options)
+_INPUT_MODE_ARGUMENTS = (
+    ("--url", {"type": str, "help": "Single YouTube URL to process"}),
+    ("--urls", {"type": str, "help": "Comma-separated list of YouTube URLs to process"}),
+    ("--file", {"type": str, "help": "File containing YouTube URLs (one per line, empty lines ignored)"}),
+    ("--example-data", {"action": "store_true", "help": "Use example data mode (default behavior)"}),
+    ("--ui", {"action": "store_true", "help": "Start web UI mode for visual queue management"}),
+)
+
+def _build_parser():
+    """Build the argument parser for the YouTube to Notion integration."""
     parser = argparse.ArgumentParser(
         description="YouTube to Notion Database Integration",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -28,36 +37,8 @@ Examples:
     
     # Create mutually exclusive group for input modes
     input_group = parser.add_mutually_exclusive_group()
-    
-    input_group.add_argument(
-        "--url",
-        type=str,
-        help="Single YouTube URL to process"
-    )
-    
-    input_group.add_argument(
-        "--urls",
-        type=str,
-        help="Comma-separated list of YouTube URLs to process"
-    )
-    
-    input_group.add_argument(
-        "--file",
-        type=str,
-        help="File containing YouTube URLs (one per line, empty lines ignored)"
-    )
-    
-    input_group.add_argument(
-        "--example-data",
-        action="store_true",
-        help="Use example data mode (default behavior)"
-    )
-    
-    input_group.add_argument(
-        "--ui",
-        action="store_true",
-        help="Start web UI mode for visual queue management"
-    )
+    for flag, options in _INPUT_MODE_ARGUMENTS:
+        input_group.add_argument(flag, **options)
     
     parser.add_argument(
         "--prompt",
@@ -65,7 +46,19 @@ Examples:
         help="Custom prompt for AI summary generation (only used with --url)"
     )
     
-    return parser.parse_args()
+    return parser
+
+# The parser configuration never changes, so build it once at import
+_PARSER = _build_parser()
+
+def parse_arguments(argv=None):
+    """
+    Parse command-line arguments for the YouTube to Notion integration.
+    
+    Args:
+        argv: Argument list to parse (defaults to sys.argv[1:])
+    """
+    return _PARSER.parse_args(argv)
 
 def parse_urls_from_file(file_path):
     """Parse YouTube URLs from a file, ignoring empty lines."""
@@ -84,9 +77,14 @@ def parse_urls_from_file(file_path):
         print(f"Error reading file '{file_path}': {e}", file=sys.stderr)
         sys.exit(1)
 
-def main_cli():
-    """Main CLI function that handles argument parsing and delegates to appropriate mode."""
-    args = parse_arguments()
+def main_cli(argv=None):
+    """
+    Main CLI function that handles argument parsing and delegates to appropriate mode.
+    
+    Args:
+        argv: Argument list to parse (defaults to sys.argv[1:])
+    """
+    args = parse_arguments(argv)
     
     # Validate arguments
     if args.prompt and not args.url: